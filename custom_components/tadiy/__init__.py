@@ -540,7 +540,6 @@ async def async_register_services(
             from .core.schedule_model import RoomSchedule
 
             room_schedule = RoomSchedule(room_name=room_name)
-            room_coord.schedule_engine._room_schedules[room_name] = room_schedule
 
         # Set the schedule based on mode and type
         if mode == "normal":
@@ -553,6 +552,9 @@ async def async_register_services(
         else:
             room_schedule.set_custom_schedule(mode, day_schedule)
 
+        # Store through the engine so its cached block lookups are rebuilt
+        room_coord.schedule_engine.update_room_schedule(room_name, room_schedule)
+
         # Save and refresh
         await room_coord.async_save_schedules()
         await room_coord.async_request_refresh()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -276,14 +277,7 @@ class TaDIYHubCoordinator(DataUpdateCoordinator):
                     location_status = "Away (nobody home)"
 
                 data_dict["location_status"] = location_status
-                data_dict["location_attributes"] = {
-                    "anyone_home": location_state.anyone_home,
-                    "person_count_home": location_state.person_count_home,
-                    "person_count_total": location_state.person_count_total,
-                    "persons_home": location_state.persons_home,
-                    "persons_away": location_state.persons_away,
-                    "last_updated": location_state.last_updated.isoformat(),
-                }
+                data_dict["location_attributes"] = location_state.to_dict()
             else:
                 data_dict["location_status"] = "Disabled"
                 data_dict["location_attributes"] = {}
@@ -1014,6 +1008,10 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         """Log debug message if category enabled."""
         self._logger.debug(category, message, *args)
 
+    def is_debug_enabled(self, category: str) -> bool:
+        """Check if debug messages for a category would be logged."""
+        return self._logger.is_enabled(category)
+
     def _debug_callback(self, category: str, message: str, args: tuple) -> None:
         """Callback for debug logging from sub-components."""
         self._logger.debug(category, message, *args)
@@ -1093,7 +1091,7 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         try:
             from .core.schedule_model import RoomSchedule
 
-            room_schedule = RoomSchedule.from_dict(data)
+            room_schedule = RoomSchedule.from_dict_trusted(data)
             self.schedule_engine.update_room_schedule(
                 self.room_config.name, room_schedule
             )
@@ -1505,8 +1503,13 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
                 )
             elif use_curve and self.heating_curve is not None:
                 # Update heating curve slope
-                self.heating_curve.config.curve_slope = data.get(
-                    "heating_curve_slope", DEFAULT_HEATING_CURVE_SLOPE
+                self.heating_curve.reconfigure(
+                    replace(
+                        self.heating_curve.config,
+                        curve_slope=data.get(
+                            "heating_curve_slope", DEFAULT_HEATING_CURVE_SLOPE
+                        ),
+                    )
                 )
                 _LOGGER.debug(
                     "Updated heating curve slope for room %s (slope=%.2f)",
@@ -1564,16 +1567,18 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
 
     def get_hub_settings(self) -> dict[str, Any]:
         """Get hub global settings."""
-        if self.hub_coordinator:
-            return self.hub_coordinator.global_settings
+        hub = self.hub_coordinator
+        if hub:
+            return hub.global_settings
         return {}
 
     def get_hub_mode(self) -> str:
         """Get current hub mode."""
-        if self.hub_coordinator:
+        hub = self.hub_coordinator
+        if hub:
             # IMPORTANT: Call get_hub_mode() to trigger _update_hub_mode()
             # which reads the current state from the Select entity
-            return self.hub_coordinator.get_hub_mode()
+            return hub.get_hub_mode()
         return "normal"
 
     def get_early_start_offset(self) -> int:
@@ -1633,12 +1638,14 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
 
     def get_scheduled_target(self) -> float | None:
         """Get scheduled target temperature for this room (with optional heating curve and weather prediction)."""
+        # Snapshot the hub once; the property walks hass.data on every access
+        hub = self.hub_coordinator
         mode = self.get_hub_mode()
 
         # Read friday_weekend_start_hour from hub global settings (default: 24 = disabled)
         friday_weekend_start_hour = DEFAULT_FRIDAY_WEEKEND_START_HOUR
-        if self.hub_coordinator:
-            friday_weekend_start_hour = self.hub_coordinator.global_settings.get(
+        if hub:
+            friday_weekend_start_hour = hub.global_settings.get(
                 CONF_FRIDAY_WEEKEND_START_HOUR, DEFAULT_FRIDAY_WEEKEND_START_HOUR
             )
 
@@ -1686,12 +1693,10 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         if (
             base_target is not None
             and self.room_config.use_weather_prediction
-            and self.hub_coordinator
+            and hub
             and self._cached_outdoor_temp is not None
         ):
-            weather_adjustment = self.hub_coordinator.get_weather_adjustment(
-                self._cached_outdoor_temp
-            )
+            weather_adjustment = hub.get_weather_adjustment(self._cached_outdoor_temp)
             if abs(weather_adjustment) > 0.1:  # Only apply meaningful adjustments
                 adjusted = base_target + weather_adjustment
                 self.debug(
@@ -1707,13 +1712,11 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         if (
             base_target is not None
             and self.room_config.use_room_coupling
-            and self.hub_coordinator
+            and hub
             and self.room_config.adjacent_rooms
         ):
-            coupling_adjustment = (
-                self.hub_coordinator.room_coupling_manager.get_coupling_adjustment(
-                    self.room_config.name
-                )
+            coupling_adjustment = hub.room_coupling_manager.get_coupling_adjustment(
+                self.room_config.name
             )
             if abs(coupling_adjustment) > 0.05:  # Only apply meaningful adjustments
                 adjusted = base_target + coupling_adjustment
@@ -2053,12 +2056,13 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
             return True
         return False
 
-    def _check_firmware_lockout_expiry(self) -> None:
+    def _check_firmware_lockout_expiry(self, now: datetime | None = None) -> None:
         """Check and clear expired firmware revert lockouts."""
         if not self._firmware_revert_lockout_until:
             return
 
-        now = dt_util.utcnow()
+        if now is None:
+            now = dt_util.utcnow()
         expired = [
             trv_id
             for trv_id, lockout_until in self._firmware_revert_lockout_until.items()
@@ -2078,8 +2082,12 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         """Fetch and process room data using modular managers."""
         self.debug("rooms", "Starting room update cycle")
 
+        # Single timestamp shared by all time-based checks of this cycle
+        now = dt_util.utcnow()
+        self.schedule_engine.prepare_tick(dt_util.as_local(now))
+
         # Check firmware revert lockout expiry
-        self._check_firmware_lockout_expiry()
+        self._check_firmware_lockout_expiry(now)
 
         # 1. Gather Sensor Data
         fused_temp = self.sensor_manager.get_fused_temperature()
@@ -2115,7 +2123,7 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         scheduled_target = self.get_scheduled_target()
 
         # Check for expired overrides first
-        expired = self.override_manager.check_expired_overrides()
+        expired = self.override_manager.check_expired_overrides(now)
         if expired:
             self.debug("rooms", "Expired overrides cleared: %s", expired)
 
@@ -2180,16 +2188,18 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         prev_phase = self.valve_protection.state.cycle_phase
 
         # Sync schedule from hub global settings so config changes take effect live
-        if self.hub_coordinator:
+        hub = self.hub_coordinator
+        if hub:
             from datetime import time as dt_time
 
-            vp_day = self.hub_coordinator.global_settings.get(
+            global_settings = hub.global_settings
+            vp_day = global_settings.get(
                 CONF_VALVE_PROTECTION_DAY, DEFAULT_VALVE_PROTECTION_DAY
             )
-            vp_hour = self.hub_coordinator.global_settings.get(
+            vp_hour = global_settings.get(
                 CONF_VALVE_PROTECTION_HOUR, DEFAULT_VALVE_PROTECTION_HOUR
             )
-            vp_interval = self.hub_coordinator.global_settings.get(
+            vp_interval = global_settings.get(
                 CONF_VALVE_PROTECTION_INTERVAL_WEEKS,
                 DEFAULT_VALVE_PROTECTION_INTERVAL_WEEKS,
             )
@@ -2394,3 +2404,4 @@ class TaDIYRoomCoordinator(DataUpdateCoordinator):
         for remove_listener in self._state_listeners:
             remove_listener()
         self._state_listeners.clear()
+        self.sensor_manager.remove_listeners()
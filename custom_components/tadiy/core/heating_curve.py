@@ -28,7 +28,19 @@ class HeatingCurve:
         Args:
             config: Heating curve configuration
         """
-        self.config = config or HeatingCurveConfig()
+        self.reconfigure(config or HeatingCurveConfig())
+
+    def reconfigure(self, config: HeatingCurveConfig) -> None:
+        """Apply a new configuration and refresh the cached curve constants.
+
+        Args:
+            config: Heating curve configuration
+        """
+        self.config = config
+        self._ref = config.outdoor_reference_temp
+        self._slope = config.curve_slope
+        self._lo = config.min_indoor_target
+        self._hi = config.max_indoor_target
 
     def calculate_target(
         self,
@@ -44,24 +56,22 @@ class HeatingCurve:
         Returns:
             Adjusted target temperature (°C)
         """
-        outdoor_delta = outdoor_temp - self.config.outdoor_reference_temp
-        target_adjustment = -1 * self.config.curve_slope * outdoor_delta
+        outdoor_delta = outdoor_temp - self._ref
+        target_adjustment = -self._slope * outdoor_delta
 
         adjusted_target = base_target + target_adjustment
 
-        adjusted_target = max(
-            self.config.min_indoor_target,
-            min(self.config.max_indoor_target, adjusted_target),
-        )
-
-        _LOGGER.debug(
-            "Heating curve: outdoor=%.1f°C, base_target=%.1f°C, "
-            "adjustment=%.1f°C, final=%.1f°C",
-            outdoor_temp,
-            base_target,
-            target_adjustment,
-            adjusted_target,
-        )
+        adjusted_target = max(self._lo, min(self._hi, adjusted_target))
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Heating curve: outdoor=%.1f°C, base_target=%.1f°C, "
+                "adjustment=%.1f°C, final=%.1f°C",
+                outdoor_temp,
+                base_target,
+                target_adjustment,
+                adjusted_target,
+            )
 
         return round(adjusted_target, 1)
 
@@ -9,7 +9,8 @@ Provides gradual temperature reduction when everyone leaves:
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -23,6 +24,9 @@ AWAY_GRACE_PERIOD: int = 1800  # 30 min: no reduction
 AWAY_PARTIAL_PERIOD: int = 7200  # 2 h: partial reduction
 AWAY_PARTIAL_REDUCTION: float = 2.0  # °C to reduce during partial period
 
+# Person states that count as home (HA reports "home" lowercase)
+_HOME_STATES: frozenset[str] = frozenset(("home", "Home", "HOME"))
+
 
 @dataclass
 class LocationState:
@@ -34,6 +38,9 @@ class LocationState:
     persons_home: list[str] = None
     persons_away: list[str] = None
     last_updated: datetime = None
+    _dict_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize default values."""
@@ -45,15 +52,21 @@ class LocationState:
             self.last_updated = dt_util.utcnow()
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "anyone_home": self.anyone_home,
-            "person_count_home": self.person_count_home,
-            "person_count_total": self.person_count_total,
-            "persons_home": self.persons_home,
-            "persons_away": self.persons_away,
-            "last_updated": self.last_updated.isoformat(),
-        }
+        """Convert to dictionary.
+
+        The manager creates a new LocationState on every update, so the
+        dict is built once per state and reused for subsequent reads.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "anyone_home": self.anyone_home,
+                "person_count_home": self.person_count_home,
+                "person_count_total": self.person_count_total,
+                "persons_home": self.persons_home,
+                "persons_away": self.persons_away,
+                "last_updated": self.last_updated.isoformat(),
+            }
+        return self._dict_cache
 
 
 class LocationManager:
@@ -74,6 +87,8 @@ class LocationManager:
         )
         self._debug_fn = debug_callback
         self._away_since: datetime | None = None  # When everyone left
+        # Monotonic counterpart of _away_since used for duration math
+        self._away_since_monotonic: float | None = None
 
     def get_location_state(self) -> LocationState:
         """Get current location state."""
@@ -103,14 +118,16 @@ class LocationManager:
         """
         # Check for manual override
         if self._manual_override is not None:
+            # Copy the configured ids so consumers cannot mutate our list
+            forced_home = self._manual_override
+            persons = list(self.person_entity_ids)
+            person_count = len(persons)
             self._location_state = LocationState(
-                anyone_home=self._manual_override,
-                person_count_home=len(self.person_entity_ids)
-                if self._manual_override
-                else 0,
-                person_count_total=len(self.person_entity_ids),
-                persons_home=self.person_entity_ids if self._manual_override else [],
-                persons_away=[] if self._manual_override else self.person_entity_ids,
+                anyone_home=forced_home,
+                person_count_home=person_count if forced_home else 0,
+                person_count_total=person_count,
+                persons_home=persons if forced_home else [],
+                persons_away=[] if forced_home else persons,
                 last_updated=dt_util.utcnow(),
             )
             return self._location_state
@@ -137,8 +154,12 @@ class LocationManager:
                 _LOGGER.warning("Person entity %s not found", entity_id)
                 continue
 
-            # Person is home if state is "home" (case-insensitive)
-            if state.state.lower() == "home":
+            # Person is home if state is "home" (case-insensitive, only
+            # lowercased when the state is not already a known token)
+            person_state = state.state
+            if person_state in _HOME_STATES or (
+                not person_state.islower() and person_state.lower() == "home"
+            ):
                 persons_home.append(entity_id)
             else:
                 persons_away.append(entity_id)
@@ -158,24 +179,29 @@ class LocationManager:
             if self._away_since is not None:
                 self._debug(
                     "Someone returned home after %d min away",
-                    int((dt_util.utcnow() - self._away_since).total_seconds() / 60),
+                    int(self.get_away_duration_seconds() / 60),
                 )
             self._away_since = None
+            self._away_since_monotonic = None
         elif self._away_since is None:
             self._away_since = dt_util.utcnow()
+            self._away_since_monotonic = time.monotonic()
             self._debug("Everyone left - away timer started")
 
-        self._debug(
-            "Location updated: %d/%d home (%s)",
-            self._location_state.person_count_home,
-            self._location_state.person_count_total,
-            "anyone_home" if self._location_state.anyone_home else "all_away",
-        )
+        if self._debug_fn or _LOGGER.isEnabledFor(logging.DEBUG):
+            self._debug(
+                "Location updated: %d/%d home (%s)",
+                self._location_state.person_count_home,
+                self._location_state.person_count_total,
+                "anyone_home" if self._location_state.anyone_home else "all_away",
+            )
 
         return self._location_state
 
     def _debug(self, message: str, *args) -> None:
         """Log debug message if callback is set."""
+        if not self._debug_fn and not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
         if self._debug_fn:
             self._debug_fn("hub", message, args)
         else:
@@ -199,9 +225,9 @@ class LocationManager:
 
     def get_away_duration_seconds(self) -> float:
         """Return how long everyone has been away (0 if someone is home)."""
-        if self._away_since is None:
+        if self._away_since_monotonic is None:
             return 0.0
-        return (dt_util.utcnow() - self._away_since).total_seconds()
+        return time.monotonic() - self._away_since_monotonic
 
     def get_gradual_away_target(
         self, scheduled_target: float, away_target: float
@@ -213,29 +239,24 @@ class LocationManager:
         Phase 3 (>120 min):   use full away_target
         """
         duration = self.get_away_duration_seconds()
+        grace_period = AWAY_GRACE_PERIOD
+        partial_period = AWAY_PARTIAL_PERIOD
+
+        if duration < grace_period:
+            phase = 1
+            target = scheduled_target
+        elif duration < partial_period:
+            phase = 2
+            target = max(away_target, scheduled_target - AWAY_PARTIAL_REDUCTION)
+        else:
+            phase = 3
+            target = away_target
 
-        if duration < AWAY_GRACE_PERIOD:
-            self._debug(
-                "Away gradual: grace period (%d/%d min) -> keep %.1f°C",
-                int(duration / 60),
-                AWAY_GRACE_PERIOD // 60,
-                scheduled_target,
-            )
-            return scheduled_target
-
-        if duration < AWAY_PARTIAL_PERIOD:
-            partial = max(away_target, scheduled_target - AWAY_PARTIAL_REDUCTION)
+        if self._debug_fn or _LOGGER.isEnabledFor(logging.DEBUG):
             self._debug(
-                "Away gradual: partial reduction (%d min) -> %.1f°C (-%s°C)",
+                "Away gradual: phase=%d (%d min away) -> %.1f°C",
+                phase,
                 int(duration / 60),
-                partial,
-                AWAY_PARTIAL_REDUCTION,
+                target,
             )
-            return partial
-
-        self._debug(
-            "Away gradual: full reduction (%d min) -> %.1f°C",
-            int(duration / 60),
-            away_target,
-        )
-        return away_target
+        return target
@@ -3,57 +3,84 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any
 
+from ..const import DOMAIN
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class TaDIYLogger:
     """Centralized logger for TaDIY with granular debug levels."""
 
-    # Category to config key mapping
+    # Category to config key mapping (keys are lowercase and interned so
+    # lookups from literal call sites hit the identity fast path)
     CATEGORY_MAPPING = {
-        "rooms": "debug_rooms",
-        "hub": "debug_hub",
-        "panel": "debug_panel",
-        "ui": "debug_ui",
-        "cards": "debug_cards",
-        "trv": "debug_trv",
-        "sensors": "debug_sensors",
-        "schedule": "debug_schedule",
-        "heating": "debug_heating",
-        "calibration": "debug_calibration",
-        "early_start": "debug_early_start",
-        "verbose": "debug_verbose",
+        sys.intern(category): f"debug_{category}"
+        for category in (
+            "rooms",
+            "hub",
+            "panel",
+            "ui",
+            "cards",
+            "trv",
+            "sensors",
+            "schedule",
+            "heating",
+            "calibration",
+            "early_start",
+            "verbose",
+        )
     }
 
+    # Precomputed log prefixes, avoids category.upper() per emitted record
+    CATEGORY_TAGS = {category: category.upper() for category in CATEGORY_MAPPING}
+
     def __init__(self, context: Any) -> None:
         """Initialize the logger context."""
         self.context = context
         # context can be a coordinator or a dict
+        self._cached_hub: Any = None
+        self._config_cache: dict | None = None
 
     def debug(self, category: str, message: str, *args: Any) -> None:
-        """Log a debug message if the category is enabled."""
-        enabled = self._is_enabled(category)
-        if enabled:
-            # Prefix with category for easier filtering
-            prefix = f"[{category.upper()}] "
-
-            # Try to get room name from context
-            room_name = None
-            if hasattr(self.context, "room_config"):
-                room_name = self.context.room_config.name
-            elif isinstance(self.context, dict) and "room_name" in self.context:
-                room_name = self.context["room_name"]
-
-            if room_name:
-                prefix += f"({room_name}) "
-
-            _LOGGER.debug(prefix + message, *args)
+        """Log a debug message if the category is enabled.
+
+        The category must be one of the lowercase CATEGORY_MAPPING keys.
+        """
+        # Skip all work when the Python logger would drop the record anyway
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
+        if not self._is_enabled(category):
+            return
+
+        # Try to get room name from context
+        room_name = None
+        if hasattr(self.context, "room_config"):
+            room_name = self.context.room_config.name
+        elif isinstance(self.context, dict) and "room_name" in self.context:
+            room_name = self.context["room_name"]
+
+        # Prefix with category for easier filtering; the logger builds the
+        # final string only when a handler actually emits the record
+        if room_name:
+            _LOGGER.debug(
+                "[%s] (%s) " + message, self.CATEGORY_TAGS[category], room_name, *args
+            )
+        else:
+            _LOGGER.debug("[%s] " + message, self.CATEGORY_TAGS[category], *args)
+
+    def is_enabled(self, category: str) -> bool:
+        """Return True if a debug message for this category would be logged."""
+        return _LOGGER.isEnabledFor(logging.DEBUG) and self._is_enabled(category)
 
     def _is_enabled(self, category: str) -> bool:
-        """Check if a debug category is enabled in hub config."""
-        config_key = self.CATEGORY_MAPPING.get(category.lower())
+        """Check if a debug category is enabled in hub config.
+
+        Callers pass lowercase category tokens (e.g. "hub", "rooms").
+        """
+        config_key = self.CATEGORY_MAPPING.get(category)
         if not config_key:
             return False
 
@@ -69,34 +96,43 @@ class TaDIYLogger:
         return config.get(config_key, False)
 
     def _get_config(self) -> dict | None:
-        """Get the config dictionary from context."""
+        """Get the config dictionary from context.
+
+        The resolved hub config dict is cached and reused as long as the
+        same hub coordinator is active; the dict itself is shared with the
+        hub, so option changes are still visible without invalidation.
+        """
+        context = self.context
+
         # 1. Try to get config from raw dict context
-        if isinstance(self.context, dict):
-            return self.context
+        if isinstance(context, dict):
+            return context
 
         # 2. Try to get hub from coordinator's hub_coordinator attribute
-        hub = getattr(self.context, "hub_coordinator", None)
+        hub = getattr(context, "hub_coordinator", None)
+
+        # Fast path: hub unchanged since the last lookup
+        if hub is self._cached_hub and self._config_cache is not None:
+            return self._config_cache
+
+        self._cached_hub = hub
+        self._config_cache = None
 
         # 3. If context IS the hub (has config_data attribute)
-        if not hub and hasattr(self.context, "config_data"):
-            hub = self.context
+        if hub is None and getattr(context, "config_data", None) is not None:
+            hub = context
 
         # 4. Try to get from hass.data
-        if not hub and hasattr(self.context, "hass"):
-            try:
-                from ..const import DOMAIN
-
-                domain_data = self.context.hass.data.get(DOMAIN)
-                if domain_data and isinstance(domain_data, dict):
+        if hub is None:
+            hass = getattr(context, "hass", None)
+            if hass is not None:
+                domain_data = hass.data.get(DOMAIN)
+                if isinstance(domain_data, dict):
                     hub = domain_data.get("hub_coordinator")
-            except Exception:
-                pass
-
-        if not hub or not hasattr(hub, "config_data"):
-            return None
 
-        config = hub.config_data
+        config = getattr(hub, "config_data", None)
         if not isinstance(config, dict):
             return None
 
+        self._config_cache = config
         return config
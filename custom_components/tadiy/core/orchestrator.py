@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
 
-from homeassistant.util import dt as dt_util
+from ..const import DEFAULT_FROST_PROTECTION_TEMP, DEFAULT_OFF_TEMPERATURE
 
 if TYPE_CHECKING:
-    from ..coordinator import TaDIYRoomCoordinator
+    from ..coordinator import TaDIYHubCoordinator, TaDIYRoomCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,25 +22,36 @@ class RoomOrchestrator:
         """Initialize."""
         self.coordinator = room_coordinator
         self.room_config = room_coordinator.room_config
-        self._last_user_interaction: datetime | None = None
+        # Debug helpers pre-bound to the "rooms" category
+        self._debug = partial(room_coordinator.debug, "rooms")
+        self._debug_enabled = partial(room_coordinator.is_debug_enabled, "rooms")
+        # Monotonic timestamp of the last user interaction
+        self._last_user_interaction: float | None = None
         self._interaction_grace_seconds = 5
+        # Bound should_heat of the current heating controller; the controller
+        # is created after the orchestrator and may be replaced at runtime
+        self._heating_controller: Any = None
+        self._should_heat: Callable[[float, float], tuple[bool, float]] | None = None
+        # Steady-state memo for the override/schedule branches of
+        # calculate_target_temperature (see there)
+        self._last_target_inputs: tuple | None = None
+        self._last_target_output: tuple[float, bool] | None = None
 
     def notify_user_interaction(self) -> None:
         """Called when a user manually changes temperature or mode."""
-        self._last_user_interaction = dt_util.utcnow()
-        self.coordinator.debug(
-            "rooms",
+        self._last_user_interaction = time.monotonic()
+        self._debug(
             "User interaction detected - starting %ds grace period",
             self._interaction_grace_seconds,
         )
 
     def is_in_grace_period(self) -> bool:
         """Check if we are currently in the user interaction grace period."""
-        if not self._last_user_interaction:
+        last_interaction = self._last_user_interaction
+        if last_interaction is None:
             return False
 
-        delta = (dt_util.utcnow() - self._last_user_interaction).total_seconds()
-        return delta < self._interaction_grace_seconds
+        return time.monotonic() - last_interaction < self._interaction_grace_seconds
 
     def calculate_target_temperature(
         self,
@@ -55,120 +67,149 @@ class RoomOrchestrator:
         Returns:
             (target_temperature, enforce_target)
         """
-        from ..const import DEFAULT_FROST_PROTECTION_TEMP, DEFAULT_OFF_TEMPERATURE
-
-        # Get frost protection temp from hub
-        frost_protection = DEFAULT_FROST_PROTECTION_TEMP
-        if self.coordinator.hub_coordinator:
-            frost_protection = (
-                self.coordinator.hub_coordinator.get_frost_protection_temp()
-            )
-
-        # Get off mode temperature from hub config
-        off_temperature = DEFAULT_OFF_TEMPERATURE
-        if self.coordinator.hub_coordinator:
-            off_temperature = getattr(
-                self.coordinator.hub_coordinator,
-                "off_temperature",
-                DEFAULT_OFF_TEMPERATURE,
-            )
+        hub = self.coordinator.hub_coordinator
+        cfg = self.room_config
+        debug = self._debug
+        debug_on = self._debug_enabled()
 
         # 1. Window Open (Highest Priority)
         if window_should_stop:
-            self.coordinator.debug(
-                "rooms",
-                "Target: Window open - enforcing frost protection %.1f°C",
-                frost_protection,
-            )
+            frost_protection = self._get_frost_protection_temp(hub)
+            if debug_on:
+                debug(
+                    "Target: Window open - enforcing frost protection %.1f°C",
+                    frost_protection,
+                )
             return frost_protection, True
 
         # 1b. Hub Mode "Off" - TRVs show off_temperature but never heat
         if hub_mode == "off":
-            self.coordinator.debug(
-                "rooms",
-                "Target: Hub mode OFF - enforcing off temperature %.1f°C (no heating)",
-                off_temperature,
+            # Get off mode temperature from hub config
+            off_temperature = (
+                getattr(hub, "off_temperature", DEFAULT_OFF_TEMPERATURE)
+                if hub
+                else DEFAULT_OFF_TEMPERATURE
             )
+            if debug_on:
+                debug(
+                    "Target: Hub mode OFF - enforcing off temperature %.1f°C (no heating)",
+                    off_temperature,
+                )
             return off_temperature, True
 
         # 2. Away Mode (Hub level away) - gradual temperature reduction
-        if (
-            self.coordinator.hub_coordinator
-            and self.coordinator.hub_coordinator.should_reduce_heating_for_away()
-        ):
-            away_temp = self.room_config.away_temperature
+        if hub and hub.should_reduce_heating_for_away():
+            away_temp = cfg.away_temperature
             # Use gradual reduction: grace period → partial → full away
-            loc_mgr = self.coordinator.hub_coordinator.location_manager
-            self.coordinator.debug(
-                "rooms",
-                "Away mode active: %s/%s persons home",
-                loc_mgr.get_location_state().person_count_home,
-                loc_mgr.get_location_state().person_count_total,
-            )
+            loc_mgr = hub.location_manager
+            if debug_on:
+                location_state = loc_mgr.get_location_state()
+                debug(
+                    "Away mode active: %s/%s persons home",
+                    location_state.person_count_home,
+                    location_state.person_count_total,
+                )
             gradual_target = loc_mgr.get_gradual_away_target(
                 scheduled_target or 20.0, away_temp
             )
-            self.coordinator.debug(
-                "rooms",
-                "Target: Away mode - gradual target %.1f°C (away=%.1f°C, sched=%.1f°C)",
-                gradual_target,
-                away_temp,
-                scheduled_target or 20.0,
-            )
+            if debug_on:
+                debug(
+                    "Target: Away mode - gradual target %.1f°C (away=%.1f°C, sched=%.1f°C)",
+                    gradual_target,
+                    away_temp,
+                    scheduled_target or 20.0,
+                )
             return gradual_target, True
 
+        # Below this point the outcome depends only on these inputs. Window,
+        # off and away are handled above because they read live hub state.
+        dont_heat_below = cfg.dont_heat_below_outdoor
+        target_inputs = (
+            scheduled_target,
+            active_override_target,
+            hub_mode,
+            outdoor_temp,
+            dont_heat_below,
+        )
+        if target_inputs == self._last_target_inputs:
+            if debug_on:
+                debug(
+                    "Target: Unchanged %.1f°C",
+                    self._last_target_output[0],
+                )
+            return self._last_target_output
+
         # 3. Outdoor Temperature Threshold (Heat below outside)
         if (
             outdoor_temp is not None
-            and self.room_config.dont_heat_below_outdoor > 0
-            and outdoor_temp >= self.room_config.dont_heat_below_outdoor
+            and dont_heat_below > 0
+            and outdoor_temp >= dont_heat_below
         ):
-            self.coordinator.debug(
-                "rooms",
-                "Target: Outdoor temp %.1f >= threshold %.1f - enforcing frost protection %.1f°C",
-                outdoor_temp,
-                self.room_config.dont_heat_below_outdoor,
-                frost_protection,
-            )
+            frost_protection = self._get_frost_protection_temp(hub)
+            if debug_on:
+                debug(
+                    "Target: Outdoor temp %.1f >= threshold %.1f - enforcing frost protection %.1f°C",
+                    outdoor_temp,
+                    dont_heat_below,
+                    frost_protection,
+                )
             return frost_protection, True
 
         # 4. Manual Hub Mode (complete manual control - no schedule enforcement)
         if hub_mode == "manual":
             # In true manual mode, if there's an override, use it
             if active_override_target is not None:
-                self.coordinator.debug(
-                    "rooms",
-                    "Target: Manual mode with override %.1f°C",
-                    active_override_target,
-                )
+                if debug_on:
+                    debug(
+                        "Target: Manual mode with override %.1f°C",
+                        active_override_target,
+                    )
                 return active_override_target, True
             # Otherwise, hold last commanded temperature as baseline so TRVs don't drift
             # Fall back to scheduled target if no prior command, then 20°C
             baseline = self.coordinator._commanded_target or scheduled_target or 20.0
-            self.coordinator.debug(
-                "rooms",
-                "Target: Manual mode - holding baseline %.1f°C (no active override)",
-                baseline,
-            )
+            if debug_on:
+                debug(
+                    "Target: Manual mode - holding baseline %.1f°C (no active override)",
+                    baseline,
+                )
             return baseline, True
 
         # 5. Active Override (user set a different temperature than schedule)
         if active_override_target is not None:
-            self.coordinator.debug(
-                "rooms", "Target: Using active override %.1f°C", active_override_target
-            )
-            return active_override_target, True
+            if debug_on:
+                debug(
+                    "Target: Using active override %.1f°C",
+                    active_override_target,
+                )
+            return self._remember_target(target_inputs, active_override_target)
 
         # 6. Schedule (normal operation)
         if scheduled_target is not None:
-            self.coordinator.debug(
-                "rooms", "Target: Using scheduled target %.1f°C", scheduled_target
-            )
-            return scheduled_target, True
+            if debug_on:
+                debug("Target: Using scheduled target %.1f°C", scheduled_target)
+            return self._remember_target(target_inputs, scheduled_target)
 
         # 7. Fallback - no schedule defined for this room/mode
-        self.coordinator.debug("rooms", "Target: No schedule found, using default 20°C")
-        return 20.0, True  # Enforce a sensible default
+        if debug_on:
+            debug("Target: No schedule found, using default 20°C")
+        # Enforce a sensible default
+        return self._remember_target(target_inputs, 20.0)
+
+    def _remember_target(
+        self, target_inputs: tuple, target: float
+    ) -> tuple[float, bool]:
+        """Cache a steady-state target result for identical inputs."""
+        result = (target, True)
+        self._last_target_inputs = target_inputs
+        self._last_target_output = result
+        return result
+
+    def _get_frost_protection_temp(self, hub: TaDIYHubCoordinator | None) -> float:
+        """Get frost protection temp from hub (only fetched when a branch needs it)."""
+        if hub:
+            return hub.get_frost_protection_temp()
+        return DEFAULT_FROST_PROTECTION_TEMP
 
     def calculate_heating_decision(
         self, fused_temp: float | None, target_temp: float, hvac_mode: str
@@ -182,8 +223,10 @@ class RoomOrchestrator:
             return False
 
         # Basic hysteresis / PID check
-        should_heat, _ = self.coordinator.heating_controller.should_heat(
-            fused_temp, target_temp
-        )
+        controller = self.coordinator.heating_controller
+        if controller is not self._heating_controller:
+            self._heating_controller = controller
+            self._should_heat = controller.should_heat
 
+        should_heat, _ = self._should_heat(fused_temp, target_temp)
         return should_heat
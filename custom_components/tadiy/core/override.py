@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -19,10 +21,29 @@ from ..const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Storage format: 1 = ISO 8601 strings, 2 = epoch timestamps
+STORAGE_FORMAT_VERSION = 2
 
-@dataclass
+# Precomputed expiry offsets for the fixed-duration timeout modes
+_EXPIRY_DELTAS: dict[str, timedelta] = {
+    mode: timedelta(minutes=minutes)
+    for mode, minutes in OVERRIDE_TIMEOUT_DURATIONS.items()
+}
+_EXPIRY_FALLBACK = timedelta(hours=2)
+_ONE_DAY = timedelta(days=1)
+
+
+def _from_timestamp(timestamp: float) -> datetime:
+    """Convert a stored epoch timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(timestamp, tz=dt_util.UTC)
+
+
+@dataclass(slots=True, eq=False)
 class OverrideRecord:
-    """Record of a manual temperature override."""
+    """Record of a manual temperature override.
+
+    Records compare by identity; there is at most one per TRV entity.
+    """
 
     entity_id: str  # TRV entity ID
     started_at: datetime  # When override was detected
@@ -49,27 +70,32 @@ class OverrideRecord:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
+            "version": STORAGE_FORMAT_VERSION,
             "entity_id": self.entity_id,
-            "started_at": self.started_at.isoformat(),
+            "started_at": self.started_at.timestamp(),
             "scheduled_temp": self.scheduled_temp,
             "override_temp": self.override_temp,
             "timeout_mode": self.timeout_mode,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "expires_at": self.expires_at.timestamp() if self.expires_at else None,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> OverrideRecord:
         """Create from dictionary."""
+        # Older storage holds ISO strings instead of epoch timestamps
+        if data.get("version", 1) >= 2:
+            parse_time = _from_timestamp
+        else:
+            parse_time = datetime.fromisoformat
+
         return cls(
             entity_id=data["entity_id"],
-            started_at=datetime.fromisoformat(data["started_at"]),
+            started_at=parse_time(data["started_at"]),
             scheduled_temp=data["scheduled_temp"],
             override_temp=data["override_temp"],
             timeout_mode=data["timeout_mode"],
             expires_at=(
-                datetime.fromisoformat(data["expires_at"])
-                if data.get("expires_at")
-                else None
+                parse_time(data["expires_at"]) if data.get("expires_at") else None
             ),
         )
 
@@ -87,6 +113,11 @@ class OverrideManager:
             debug_callback: Optional callback for debug logging (category, message, args)
         """
         self._overrides: dict[str, OverrideRecord] = {}
+        # Min-heap of (expires_at, seq, entity_id, record); entries of cleared
+        # or replaced overrides are left in place and skipped lazily when
+        # popped. seq breaks ties so records themselves are never compared.
+        self._expiry_heap: list[tuple[datetime, int, str, OverrideRecord]] = []
+        self._expiry_seq = itertools.count()
         self._debug_callback = debug_callback
 
     def _debug(self, message: str, *args: Any) -> None:
@@ -155,15 +186,16 @@ class OverrideManager:
             expires_at=expires_at,
         )
 
-        self._overrides[entity_id] = override
+        self._add_override(entity_id, override)
 
-        self._debug(
-            "Override created: %.1f -> %.1f | Mode: %s | Expires: %s",
-            scheduled_temp,
-            override_temp,
-            timeout_mode,
-            expires_at.strftime("%H:%M:%S") if expires_at else "never",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            self._debug(
+                "Override created: %.1f -> %.1f | Mode: %s | Expires: %s",
+                scheduled_temp,
+                override_temp,
+                timeout_mode,
+                expires_at.strftime("%H:%M:%S") if expires_at else "never",
+            )
 
         return override
 
@@ -193,33 +225,52 @@ class OverrideManager:
         """
         count = len(self._overrides)
         self._overrides.clear()
+        self._expiry_heap.clear()
         if count > 0:
             self._debug("Cleared %d override(s)", count)
         return count
 
-    def check_expired_overrides(self) -> list[str]:
+    def check_expired_overrides(self, now: datetime | None = None) -> list[str]:
         """
         Check for expired overrides and remove them.
 
+        Args:
+            now: Current time of the calling update cycle (defaults to utcnow)
+
         Returns:
             List of entity IDs that had expired overrides
         """
-        now = dt_util.utcnow()
+        heap = self._expiry_heap
+        if not heap:
+            return []
+        if now is None:
+            now = dt_util.utcnow()
         expired = []
 
-        for entity_id, override in list(self._overrides.items()):
-            if override.is_expired(now):
+        while heap and heap[0][0] <= now:
+            _, _, entity_id, override = heapq.heappop(heap)
+            if self._overrides.get(entity_id) is override:
                 expired.append(entity_id)
                 self._overrides.pop(entity_id)
-                self._debug(
-                    "Override expired for %s (was %.1f, scheduled: %.1f)",
-                    entity_id,
-                    override.override_temp,
-                    override.scheduled_temp,
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    self._debug(
+                        "Override expired for %s (was %.1f, scheduled: %.1f)",
+                        entity_id,
+                        override.override_temp,
+                        override.scheduled_temp,
+                    )
 
         return expired
 
+    def _add_override(self, entity_id: str, override: OverrideRecord) -> None:
+        """Store an override and schedule its expiry."""
+        self._overrides[entity_id] = override
+        if override.expires_at is not None:
+            heapq.heappush(
+                self._expiry_heap,
+                (override.expires_at, next(self._expiry_seq), entity_id, override),
+            )
+
     def _calculate_expiry(
         self,
         start_time: datetime,
@@ -237,6 +288,11 @@ class OverrideManager:
         Returns:
             Expiry datetime or None for never/always
         """
+        # Fixed duration (1h-4h)
+        delta = _EXPIRY_DELTAS.get(timeout_mode)
+        if delta is not None:
+            return start_time + delta
+
         if timeout_mode == OVERRIDE_TIMEOUT_NEVER:
             return None
 
@@ -245,11 +301,6 @@ class OverrideManager:
             # but handle gracefully by expiring immediately
             return start_time
 
-        if timeout_mode in OVERRIDE_TIMEOUT_DURATIONS:
-            # Fixed duration (1h-4h)
-            minutes = OVERRIDE_TIMEOUT_DURATIONS[timeout_mode]
-            return start_time + timedelta(minutes=minutes)
-
         if timeout_mode == OVERRIDE_TIMEOUT_NEXT_BLOCK:
             # Expire at next schedule block change
             if next_block_time:
@@ -257,18 +308,18 @@ class OverrideManager:
             else:
                 # Fallback: 2 hours if next block time not available
                 _LOGGER.warning("Next block time not available, using 2h fallback")
-                return start_time + timedelta(hours=2)
+                return start_time + _EXPIRY_FALLBACK
 
         if timeout_mode == OVERRIDE_TIMEOUT_NEXT_DAY:
             # Expire at midnight (start of next day)
-            next_day = (start_time + timedelta(days=1)).replace(
+            next_day = (start_time + _ONE_DAY).replace(
                 hour=0, minute=0, second=0, microsecond=0
             )
             return next_day
 
         # Unknown mode, use default 2 hours
         _LOGGER.warning("Unknown timeout mode %s, using 2h default", timeout_mode)
-        return start_time + timedelta(hours=2)
+        return start_time + _EXPIRY_FALLBACK
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -288,7 +339,7 @@ class OverrideManager:
         for entity_id, override_data in data.items():
             try:
                 override = OverrideRecord.from_dict(override_data)
-                manager._overrides[entity_id] = override
+                manager._add_override(entity_id, override)
             except (KeyError, ValueError) as err:
                 _LOGGER.warning("Failed to load override for %s: %s", entity_id, err)
         return manager
@@ -12,8 +12,10 @@ Especially useful for:
 from __future__ import annotations
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -30,9 +32,18 @@ LEARNING_WEIGHT = (
 SETTLING_TIME = timedelta(
     minutes=10
 )  # Time to wait after reaching target before measuring overshoot
+MAX_SAMPLES = 20  # Samples kept in memory
+MAX_STORED_SAMPLES = 10  # Samples written to storage
+# Storage format: 1 = ISO 8601 strings, 2 = epoch timestamps
+STORAGE_FORMAT_VERSION = 2
 
 
-@dataclass
+def _from_timestamp(timestamp: float) -> datetime:
+    """Convert a stored epoch timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(timestamp, tz=dt_util.UTC)
+
+
+@dataclass(slots=True)
 class OvershootSample:
     """A single overshoot measurement."""
 
@@ -43,17 +54,21 @@ class OvershootSample:
     outdoor_temp: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OvershootModel:
     """Learned overshoot behavior for a room."""
 
     room_name: str
-    samples: list[OvershootSample] = field(default_factory=list)
+    samples: deque[OvershootSample] = field(
+        default_factory=lambda: deque(maxlen=MAX_SAMPLES)
+    )
     average_overshoot: float = 0.0
     compensation: float = 0.0  # How much to reduce target
     sample_count: int = 0
     last_updated: datetime | None = None
     _debug_fn: Any = field(default=None, repr=False)
+    # Whether enough samples exist to apply compensation
+    _compensation_active: bool = False
 
     # State tracking for current heating cycle
     _heating_cycle_active: bool = False
@@ -69,6 +84,15 @@ class OvershootModel:
         else:
             _LOGGER.debug(message, *args)
 
+    @staticmethod
+    def _debug_enabled() -> bool:
+        """Check if debug output can be emitted at all.
+
+        The TaDIY debug callback logs below the same package logger, so a
+        disabled DEBUG level here means the message would be dropped anyway.
+        """
+        return _LOGGER.isEnabledFor(logging.DEBUG)
+
     def start_heating_cycle(self, current_temp: float, target_temp: float) -> None:
         """Mark start of a heating cycle (idempotent — only logs on first call)."""
         if self._heating_cycle_active:
@@ -92,27 +116,31 @@ class OvershootModel:
         if not self._heating_cycle_active or self._cycle_target is None:
             return
 
-        now = dt_util.utcnow()
-
         # Check if we've reached the target
         if current_temp >= self._cycle_target:
             if self._target_reached_time is None:
-                self._target_reached_time = now
+                self._target_reached_time = dt_util.utcnow()
                 self._peak_temp_after_target = current_temp
-                self._debug(
-                    "Room %s: Target reached at %.1f°C", self.room_name, current_temp
-                )
-            else:
-                # Track peak temperature after reaching target
-                if current_temp > (self._peak_temp_after_target or 0):
-                    self._peak_temp_after_target = current_temp
-
-        # Check if settling time has passed and we have a peak
-        if (
-            self._target_reached_time is not None
-            and self._peak_temp_after_target is not None
-            and now - self._target_reached_time >= SETTLING_TIME
-        ):
+                if self._debug_enabled():
+                    self._debug(
+                        "Room %s: Target reached at %.1f°C",
+                        self.room_name,
+                        current_temp,
+                    )
+                # Settling time cannot have passed yet
+                return
+            # Track peak temperature after reaching target (always set above)
+            self._peak_temp_after_target = max(
+                self._peak_temp_after_target, current_temp
+            )
+
+        # Nothing to measure until the target has been reached
+        if self._target_reached_time is None:
+            return
+
+        # Check if settling time has passed
+        now = dt_util.utcnow()
+        if now - self._target_reached_time >= SETTLING_TIME:
             # Calculate overshoot
             overshoot = self._peak_temp_after_target - self._cycle_target
 
@@ -126,13 +154,14 @@ class OvershootModel:
                     outdoor_temp=outdoor_temp,
                 )
                 self._add_sample(sample)
-                self._debug(
-                    "Room %s: Overshoot recorded - target=%.1f, peak=%.1f, overshoot=%.1f°C",
-                    self.room_name,
-                    self._cycle_target,
-                    self._peak_temp_after_target,
-                    overshoot,
-                )
+                if self._debug_enabled():
+                    self._debug(
+                        "Room %s: Overshoot recorded - target=%.1f, peak=%.1f, overshoot=%.1f°C",
+                        self.room_name,
+                        self._cycle_target,
+                        self._peak_temp_after_target,
+                        overshoot,
+                    )
 
             # End this cycle
             self._heating_cycle_active = False
@@ -147,14 +176,11 @@ class OvershootModel:
 
     def _add_sample(self, sample: OvershootSample) -> None:
         """Add a new overshoot sample and update averages."""
+        # Bounded deque drops the oldest sample beyond MAX_SAMPLES
         self.samples.append(sample)
         self.sample_count += 1
         self.last_updated = sample.timestamp
 
-        # Keep only last 20 samples
-        if len(self.samples) > 20:
-            self.samples = self.samples[-20:]
-
         # Update exponential moving average
         if self.sample_count == 1:
             self.average_overshoot = sample.overshoot
@@ -165,7 +191,8 @@ class OvershootModel:
             )
 
         # Update compensation (only if we have enough samples)
-        if self.sample_count >= MIN_SAMPLES_FOR_COMPENSATION:
+        self._compensation_active = self.sample_count >= MIN_SAMPLES_FOR_COMPENSATION
+        if self._compensation_active:
             # Compensation is 80% of average overshoot, capped at MAX_COMPENSATION
             self.compensation = min(self.average_overshoot * 0.8, MAX_COMPENSATION)
             self._debug(
@@ -178,38 +205,45 @@ class OvershootModel:
 
     def get_compensated_target(self, target_temp: float) -> float:
         """Get target temperature with overshoot compensation applied."""
-        if self.sample_count < MIN_SAMPLES_FOR_COMPENSATION:
+        if not self._compensation_active:
             return target_temp  # Not enough data yet
 
         compensated = target_temp - self.compensation
-        self._debug(
-            "Room %s: Overshoot compensation - target=%.1f, compensated=%.1f (comp=%.2f)",
-            self.room_name,
-            target_temp,
-            compensated,
-            self.compensation,
-        )
+        if self._debug_enabled():
+            self._debug(
+                "Room %s: Overshoot compensation - target=%.1f, compensated=%.1f (comp=%.2f)",
+                self.room_name,
+                target_temp,
+                compensated,
+                self.compensation,
+            )
         return compensated
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
+            "version": STORAGE_FORMAT_VERSION,
             "room_name": self.room_name,
             "average_overshoot": self.average_overshoot,
             "compensation": self.compensation,
             "sample_count": self.sample_count,
-            "last_updated": self.last_updated.isoformat()
+            "last_updated": self.last_updated.timestamp()
             if self.last_updated
             else None,
             "samples": [
                 {
-                    "timestamp": s.timestamp.isoformat(),
+                    "timestamp": s.timestamp.timestamp(),
                     "target_temp": s.target_temp,
                     "peak_temp": s.peak_temp,
                     "overshoot": s.overshoot,
                     "outdoor_temp": s.outdoor_temp,
                 }
-                for s in self.samples[-10:]  # Only save last 10 samples
+                # Only save the most recent samples
+                for s in islice(
+                    self.samples,
+                    max(0, len(self.samples) - MAX_STORED_SAMPLES),
+                    None,
+                )
             ],
         }
 
@@ -222,21 +256,31 @@ class OvershootModel:
             compensation=data.get("compensation", 0.0),
             sample_count=data.get("sample_count", 0),
         )
+        model._compensation_active = model.sample_count >= MIN_SAMPLES_FOR_COMPENSATION
+
+        # Older storage holds ISO strings instead of epoch timestamps
+        if data.get("version", 1) >= 2:
+            parse_time = _from_timestamp
+        else:
+            parse_time = datetime.fromisoformat
 
         if data.get("last_updated"):
-            model.last_updated = datetime.fromisoformat(data["last_updated"])
+            model.last_updated = parse_time(data["last_updated"])
 
-        # Restore samples
-        for s in data.get("samples", []):
-            model.samples.append(
+        # Restore samples (bounded like at runtime, older blobs may hold more)
+        model.samples = deque(
+            (
                 OvershootSample(
-                    timestamp=datetime.fromisoformat(s["timestamp"]),
+                    timestamp=parse_time(s["timestamp"]),
                     target_temp=s["target_temp"],
                     peak_temp=s["peak_temp"],
                     overshoot=s["overshoot"],
                     outdoor_temp=s.get("outdoor_temp"),
                 )
-            )
+                for s in data.get("samples", [])
+            ),
+            maxlen=MAX_SAMPLES,
+        )
 
         return model
 
@@ -254,15 +298,18 @@ class OvershootManager:
 
     def get_or_create_model(self, room_name: str) -> OvershootModel:
         """Get or create an overshoot model for a room."""
-        if room_name not in self._models:
-            self._models[room_name] = OvershootModel(
+        model = self._models.get(room_name)
+        if model is None:
+            model = self._models[room_name] = OvershootModel(
                 room_name=room_name, _debug_fn=self._debug_fn
             )
-        return self._models[room_name]
+        return model
 
     def get_compensated_target(self, room_name: str, target_temp: float) -> float:
         """Get target with overshoot compensation for a room."""
-        model = self.get_or_create_model(room_name)
+        model = self._models.get(room_name)
+        if model is None or not model._compensation_active:
+            return target_temp
         return model.get_compensated_target(target_temp)
 
     def start_heating_cycle(
@@ -276,17 +323,22 @@ class OvershootManager:
         self, room_name: str, current_temp: float, outdoor_temp: float | None = None
     ) -> None:
         """Update temperature reading for a room."""
-        model = self.get_or_create_model(room_name)
+        # Rooms without an active heating cycle have nothing to track
+        model = self._models.get(room_name)
+        if model is None or not model._heating_cycle_active:
+            return
         model.update_temperature(current_temp, outdoor_temp)
 
     def end_heating_cycle(self, room_name: str) -> None:
         """End heating cycle for a room."""
-        if room_name in self._models:
-            self._models[room_name].end_heating_cycle()
+        model = self._models.get(room_name)
+        if model is not None:
+            model.end_heating_cycle()
 
     def get_stats(self, room_name: str) -> dict[str, Any]:
         """Get overshoot statistics for a room."""
-        if room_name not in self._models:
+        model = self._models.get(room_name)
+        if model is None:
             return {
                 "sample_count": 0,
                 "average_overshoot": 0.0,
@@ -294,7 +346,6 @@ class OvershootManager:
                 "learning_active": False,
             }
 
-        model = self._models[room_name]
         return {
             "sample_count": model.sample_count,
             "average_overshoot": round(model.average_overshoot, 2),
@@ -303,8 +354,16 @@ class OvershootManager:
         }
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert all models to dictionary for storage."""
-        return {room_name: model.to_dict() for room_name, model in self._models.items()}
+        """Convert all models to dictionary for storage.
+
+        Models that have not recorded any overshoot yet carry no learned
+        data and are skipped; they are recreated on demand after loading.
+        """
+        return {
+            room_name: model.to_dict()
+            for room_name, model in self._models.items()
+            if model.sample_count
+        }
 
     def load_from_dict(self, data: dict[str, Any]) -> None:
         """Load models from dictionary."""
@@ -1,10 +1,19 @@
-"""PID auto-tuning using Ziegler-Nichols method for TaDIY."""
+"""PID auto-tuning using Ziegler-Nichols methods for TaDIY.
+
+Two estimators run side by side while tuning is active. The inflection
+point method (open-loop reaction curve) finishes after a single heat-up
+ramp and is preferred; the relay oscillation method needs several full
+oscillations and acts as fallback when no clear inflection is found.
+"""
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import math
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from enum import IntEnum
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -16,9 +25,53 @@ MIN_OSCILLATION_PERIOD = timedelta(minutes=10)  # Minimum valid oscillation peri
 MAX_OSCILLATION_PERIOD = timedelta(hours=4)  # Maximum valid oscillation period
 MIN_AMPLITUDE = 0.2  # Minimum temperature amplitude (°C)
 REQUIRED_CYCLES = 2  # Number of oscillation cycles to measure
+MAX_STORED_OSCILLATIONS = REQUIRED_CYCLES * 4  # Bound on kept measurements
+_MIN_PERIOD_S = MIN_OSCILLATION_PERIOD.total_seconds()
+_MAX_PERIOD_S = MAX_OSCILLATION_PERIOD.total_seconds()
 
 
-@dataclass
+# Storage format: 1 = ISO 8601 strings, 2 = epoch timestamps
+STORAGE_FORMAT_VERSION = 2
+
+# Ziegler-Nichols constants
+_KU_NUMERATOR = 4.0 / math.pi  # Relay method: Ku = 4d / (pi * a)
+_KP_SCALE = 0.6  # Kp = 0.6 * Ku
+_KI_SCALE = 1.2  # Ki = 2 * Kp / Tu = 1.2 * Ku / Tu
+_KD_SCALE = 0.075  # Kd = Kp * Tu / 8 = 0.075 * Ku * Tu
+
+# Inflection point (reaction curve) constants
+SLOPE_WINDOW = timedelta(minutes=10)  # Window for the rolling dT/dt estimate
+INFLECTION_CONFIRM_SAMPLES = 3  # Declining slopes needed to confirm inflection
+MIN_INFLECTION_SLOPE = 0.5 / 3600  # Minimum heat-up rate (°C/s, i.e. 0.5°C/h)
+MIN_DEAD_TIME = 60.0  # Lower bound for the apparent dead time (s)
+MOVE_THRESHOLD = 0.05  # Rise above start that ends the dead time (°C)
+STEP_AMPLITUDE = 1.0  # Normalized heating step (same as relay amplitude d=1)
+_SLOPE_WINDOW_S = SLOPE_WINDOW.total_seconds()
+
+# Conservative limits applied to tuned gains
+_KP_MIN, _KP_MAX = 0.1, 5.0
+_KI_MIN, _KI_MAX = 0.001, 0.1
+_KD_MIN, _KD_MAX = 0.0, 1.0
+
+
+def _clamp_gains(kp: float, ki: float, kd: float) -> tuple[float, float, float]:
+    """Clamp tuned (Kp, Ki, Kd) to the conservative limits."""
+    return (
+        min(_KP_MAX, max(_KP_MIN, kp)),
+        min(_KI_MAX, max(_KI_MIN, ki)),
+        min(_KD_MAX, max(_KD_MIN, kd)),
+    )
+
+
+class Direction(IntEnum):
+    """Temperature trend; opposite directions have opposite signs."""
+
+    NONE = 0
+    RISING = 1
+    FALLING = -1
+
+
+@dataclass(slots=True)
 class OscillationMeasurement:
     """Measurement of a single temperature oscillation."""
 
@@ -26,25 +79,23 @@ class OscillationMeasurement:
     peak_temp: float
     valley_time: datetime
     valley_temp: float
+    amplitude: float = field(init=False)
+    period: timedelta = field(init=False)  # Peak to peak or valley to valley
+    period_seconds: float = field(init=False)
 
-    @property
-    def amplitude(self) -> float:
-        """Get oscillation amplitude."""
-        return abs(self.peak_temp - self.valley_temp)
-
-    @property
-    def period(self) -> timedelta:
-        """Get oscillation period (peak to peak or valley to valley)."""
-        return abs(self.valley_time - self.peak_time) * 2
+    def __post_init__(self) -> None:
+        """Precompute amplitude and period once at detection time."""
+        self.amplitude = abs(self.peak_temp - self.valley_temp)
+        self.period = abs(self.valley_time - self.peak_time) * 2
+        self.period_seconds = self.period.total_seconds()
 
     @property
     def is_valid(self) -> bool:
         """Check if measurement is valid."""
-        if self.amplitude < MIN_AMPLITUDE:
-            return False
-        if not MIN_OSCILLATION_PERIOD <= self.period <= MAX_OSCILLATION_PERIOD:
-            return False
-        return True
+        return (
+            self.amplitude >= MIN_AMPLITUDE
+            and _MIN_PERIOD_S <= self.period_seconds <= _MAX_PERIOD_S
+        )
 
 
 @dataclass
@@ -56,14 +107,14 @@ class PIDTuningState:
     started_at: datetime | None = None
 
     # Oscillation tracking
-    oscillations: list[OscillationMeasurement] = None
+    oscillations: deque[OscillationMeasurement] = None
     last_peak_temp: float | None = None
     last_peak_time: datetime | None = None
     last_valley_temp: float | None = None
     last_valley_time: datetime | None = None
 
     # Current state tracking
-    current_direction: str | None = None  # "rising" or "falling"
+    current_direction: Direction = Direction.NONE
     last_temp: float | None = None
     last_update: datetime | None = None
 
@@ -77,21 +128,36 @@ class PIDTuningState:
     tuned_kd: float | None = None
     tuning_complete: bool = False
 
+    # Parallel windows of the most recent amplitudes (°C) and periods (s)
+    _amp_buf: deque[float] = field(
+        default_factory=lambda: deque(maxlen=REQUIRED_CYCLES), init=False, repr=False
+    )
+    _period_sec_buf: deque[float] = field(
+        default_factory=lambda: deque(maxlen=REQUIRED_CYCLES), init=False, repr=False
+    )
+
+    # Storage dict, dropped whenever a persisted field changes
+    _dict_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Initialize mutable defaults."""
         if self.oscillations is None:
-            self.oscillations = []
+            self.oscillations = deque(maxlen=MAX_STORED_OSCILLATIONS)
 
     def start_tuning(self) -> None:
         """Start auto-tuning process."""
         self.tuning_active = True
         self.started_at = dt_util.utcnow()
-        self.oscillations = []
+        self.oscillations = deque(maxlen=MAX_STORED_OSCILLATIONS)
+        self._amp_buf = deque(maxlen=REQUIRED_CYCLES)
+        self._period_sec_buf = deque(maxlen=REQUIRED_CYCLES)
         self.last_peak_temp = None
         self.last_peak_time = None
         self.last_valley_temp = None
         self.last_valley_time = None
-        self.current_direction = None
+        self.current_direction = Direction.NONE
         self.last_temp = None
         self.last_update = None
         self.ultimate_gain = None
@@ -100,11 +166,13 @@ class PIDTuningState:
         self.tuned_ki = None
         self.tuned_kd = None
         self.tuning_complete = False
+        self._dict_cache = None
         _LOGGER.info("Room %s: Started PID auto-tuning", self.room_name)
 
     def stop_tuning(self) -> None:
         """Stop auto-tuning process."""
         self.tuning_active = False
+        self._dict_cache = None
         _LOGGER.info(
             "Room %s: Stopped PID auto-tuning (collected %d oscillations)",
             self.room_name,
@@ -124,68 +192,87 @@ class PIDTuningState:
         if not self.tuning_active or self.tuning_complete:
             return False
 
+        # Unchanged reading cannot reveal a peak or valley
+        last_temp = self.last_temp
+        if current_temp == last_temp:
+            return False
+
         now = dt_util.utcnow()
 
         # Initialize tracking on first measurement
-        if self.last_temp is None:
+        if last_temp is None:
             self.last_temp = current_temp
             self.last_update = now
             return False
 
-        # Detect direction change (peak or valley)
-        temp_change = current_temp - self.last_temp
-
-        # Determine current direction
-        if abs(temp_change) > 0.01:  # Ignore noise
-            if temp_change > 0:
-                new_direction = "rising"
-            else:
-                new_direction = "falling"
-
-            # Detect peak (was rising, now falling)
-            if self.current_direction == "rising" and new_direction == "falling":
-                if self.last_peak_temp is None or self.last_temp > self.last_peak_temp:
-                    # Valid peak
-                    if (
-                        self.last_valley_temp is not None
-                        and self.last_valley_time is not None
-                    ):
-                        # We have a complete oscillation
-                        oscillation = OscillationMeasurement(
-                            peak_time=self.last_update,
-                            peak_temp=self.last_temp,
-                            valley_time=self.last_valley_time,
-                            valley_temp=self.last_valley_temp,
-                        )
-
-                        if oscillation.is_valid:
-                            self.oscillations.append(oscillation)
-                            _LOGGER.debug(
-                                "Room %s: Detected oscillation #%d (amplitude=%.2f°C, period=%s)",
-                                self.room_name,
-                                len(self.oscillations),
-                                oscillation.amplitude,
-                                str(oscillation.period),
-                            )
-
-                    self.last_peak_temp = self.last_temp
-                    self.last_peak_time = self.last_update
-
-            # Detect valley (was falling, now rising)
-            elif self.current_direction == "falling" and new_direction == "rising":
-                if (
-                    self.last_valley_temp is None
-                    or self.last_temp < self.last_valley_temp
-                ):
-                    self.last_valley_temp = self.last_temp
-                    self.last_valley_time = self.last_update
-
-            self.current_direction = new_direction
-
-        # Update tracking
+        # Numeric core works on locals; state is written back once at the end
+        last_update = self.last_update
+        direction = self.current_direction
+        temp_change = current_temp - last_temp
         self.last_temp = current_temp
         self.last_update = now
 
+        # Determine current direction (ignore noise)
+        if temp_change > 0.01:
+            new_direction = Direction.RISING
+        elif temp_change < -0.01:
+            new_direction = Direction.FALLING
+        else:
+            return False
+
+        self.current_direction = new_direction
+
+        # Opposite signs mark a turning point
+        if direction * new_direction >= 0:
+            return False
+
+        # Detect valley (was falling, now rising)
+        if direction == Direction.FALLING:
+            if self.last_valley_temp is None or last_temp < self.last_valley_temp:
+                self.last_valley_temp = last_temp
+                self.last_valley_time = last_update
+            return False
+
+        # Detect peak (was rising, now falling)
+        if self.last_peak_temp is not None and last_temp <= self.last_peak_temp:
+            return False
+
+        # Valid peak
+        valley_temp = self.last_valley_temp
+        valley_time = self.last_valley_time
+        self.last_peak_temp = last_temp
+        self.last_peak_time = last_update
+        if valley_temp is None or valley_time is None:
+            return False
+
+        # We have a complete oscillation - validate the raw values before
+        # allocating a measurement for it
+        amplitude = abs(last_temp - valley_temp)
+        period_seconds = 2 * abs((valley_time - last_update).total_seconds())
+        if not (
+            amplitude >= MIN_AMPLITUDE
+            and _MIN_PERIOD_S <= period_seconds <= _MAX_PERIOD_S
+        ):
+            return False
+
+        oscillation = OscillationMeasurement(
+            peak_time=last_update,
+            peak_temp=last_temp,
+            valley_time=valley_time,
+            valley_temp=valley_temp,
+        )
+        self.oscillations.append(oscillation)
+        self._amp_buf.append(amplitude)
+        self._period_sec_buf.append(period_seconds)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Room %s: Detected oscillation #%d (amplitude=%.2f°C, period=%.1fs)",
+                self.room_name,
+                len(self.oscillations),
+                oscillation.amplitude,
+                oscillation.period_seconds,
+            )
+
         # Check if we have enough oscillations to calculate PID parameters
         if len(self.oscillations) >= REQUIRED_CYCLES:
             self._calculate_pid_parameters()
@@ -199,37 +286,29 @@ class PIDTuningState:
             return
 
         # Calculate average amplitude and period from last oscillations
-        recent_oscillations = self.oscillations[-REQUIRED_CYCLES:]
-        avg_amplitude = sum(osc.amplitude for osc in recent_oscillations) / len(
-            recent_oscillations
-        )
-        avg_period_seconds = sum(
-            osc.period.total_seconds() for osc in recent_oscillations
-        ) / len(recent_oscillations)
+        amplitude_total = 0.0
+        period_total = 0.0
+        for amplitude, period_seconds in zip(self._amp_buf, self._period_sec_buf):
+            amplitude_total += amplitude
+            period_total += period_seconds
+        avg_amplitude = amplitude_total / REQUIRED_CYCLES
+        avg_period_seconds = period_total / REQUIRED_CYCLES
 
         # Estimate ultimate gain (Ku) using relay method
         # This is a simplified estimation - in reality would need controlled relay test
         # For now, use a conservative estimate based on amplitude
-        self.ultimate_gain = 4.0 / (3.14159 * avg_amplitude)  # Simplified relay formula
-
-        # Ultimate period (Tu)
-        self.ultimate_period = avg_period_seconds
-
-        # Ziegler-Nichols PID tuning rules (classic method)
-        # Kp = 0.6 * Ku
-        # Ki = 2 * Kp / Tu = 1.2 * Ku / Tu
-        # Kd = Kp * Tu / 8 = 0.075 * Ku * Tu
-
-        self.tuned_kp = 0.6 * self.ultimate_gain
-        self.tuned_ki = 1.2 * self.ultimate_gain / self.ultimate_period
-        self.tuned_kd = 0.075 * self.ultimate_gain * self.ultimate_period
-
-        # Apply conservative limits
-        self.tuned_kp = max(0.1, min(5.0, self.tuned_kp))
-        self.tuned_ki = max(0.001, min(0.1, self.tuned_ki))
-        self.tuned_kd = max(0.0, min(1.0, self.tuned_kd))
+        ultimate_gain = _KU_NUMERATOR / avg_amplitude
+
+        # Ziegler-Nichols PID tuning rules (classic method) with conservative limits
+        self.ultimate_gain, self.ultimate_period = ultimate_gain, avg_period_seconds
+        self.tuned_kp, self.tuned_ki, self.tuned_kd = _clamp_gains(
+            _KP_SCALE * ultimate_gain,
+            _KI_SCALE * ultimate_gain / avg_period_seconds,
+            _KD_SCALE * ultimate_gain * avg_period_seconds,
+        )
 
         self.tuning_complete = True
+        self._dict_cache = None
 
         _LOGGER.info(
             "Room %s: PID auto-tuning complete - "
@@ -242,6 +321,12 @@ class PIDTuningState:
             self.tuned_kd,
         )
 
+    def complete_with_parameters(self, kp: float, ki: float, kd: float) -> None:
+        """Finish tuning with parameters found by another estimator."""
+        self.tuned_kp, self.tuned_ki, self.tuned_kd = kp, ki, kd
+        self.tuning_complete = True
+        self._dict_cache = None
+
     def get_tuned_parameters(self) -> tuple[float, float, float] | None:
         """
         Get tuned PID parameters.
@@ -254,11 +339,22 @@ class PIDTuningState:
         return (self.tuned_kp, self.tuned_ki, self.tuned_kd)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage."""
+        """Convert to dictionary for storage.
+
+        Persisted fields only change when tuning starts, stops or
+        completes, so the dict is rebuilt only after one of those.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the storage dictionary."""
         return {
+            "version": STORAGE_FORMAT_VERSION,
             "room_name": self.room_name,
             "tuning_active": self.tuning_active,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "started_at": self.started_at.timestamp() if self.started_at else None,
             "tuning_complete": self.tuning_complete,
             "ultimate_gain": self.ultimate_gain,
             "ultimate_period": self.ultimate_period,
@@ -270,14 +366,18 @@ class PIDTuningState:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PIDTuningState:
         """Create from dictionary."""
+        started_at = data.get("started_at")
+        if started_at:
+            # Older storage holds an ISO string instead of an epoch timestamp
+            if data.get("version", 1) >= 2:
+                started_at = datetime.fromtimestamp(started_at, tz=dt_util.UTC)
+            else:
+                started_at = datetime.fromisoformat(started_at)
+
         return cls(
             room_name=data["room_name"],
             tuning_active=data.get("tuning_active", False),
-            started_at=(
-                datetime.fromisoformat(data["started_at"])
-                if data.get("started_at")
-                else None
-            ),
+            started_at=started_at or None,
             tuning_complete=data.get("tuning_complete", False),
             ultimate_gain=data.get("ultimate_gain"),
             ultimate_period=data.get("ultimate_period"),
@@ -287,19 +387,153 @@ class PIDTuningState:
         )
 
 
+class InflectionPIDTuner:
+    """PID tuning from the inflection point of a single heat-up ramp.
+
+    Tracks a rolling dT/dt estimate and takes the point of maximum slope
+    once the slope has declined for INFLECTION_CONFIRM_SAMPLES readings.
+    The tangent through that point gives the reaction rate R (slope per
+    unit step) and the apparent dead time L, from which the classic
+    Ziegler-Nichols open-loop rules derive the gains:
+    Kp = 1.2 / (R * L), Ti = 2 * L, Td = 0.5 * L.
+    """
+
+    def __init__(self, room_name: str) -> None:
+        """Initialize inflection tuner."""
+        self.room_name = room_name
+        self.active = False
+        self.result: tuple[float, float, float] | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear ramp tracking state."""
+        self._window: deque[tuple[float, float]] = deque()
+        self._start_time: float | None = None
+        self._start_temp = 0.0
+        self._moved_at: float | None = None
+        self._max_slope = 0.0
+        self._inflection_time = 0.0
+        self._inflection_temp = 0.0
+        self._declining = 0
+
+    def start(self) -> None:
+        """Start tracking a new heat-up ramp."""
+        self._reset()
+        self.result = None
+        self.active = True
+
+    def stop(self) -> None:
+        """Stop tracking."""
+        self.active = False
+
+    def update(self, current_temp: float) -> tuple[float, float, float] | None:
+        """
+        Feed a temperature reading.
+
+        Args:
+            current_temp: Current room temperature
+
+        Returns:
+            Tuned PID parameters (Kp, Ki, Kd) once the inflection is found
+        """
+        if not self.active:
+            return None
+
+        now = dt_util.utcnow().timestamp()
+
+        if self._start_time is None:
+            self._start_time = now
+            self._start_temp = current_temp
+            self._window.append((now, current_temp))
+            return None
+
+        elapsed = now - self._start_time
+        if elapsed > _MAX_PERIOD_S:
+            # No usable ramp - leave tuning to the relay method
+            _LOGGER.debug(
+                "Room %s: No inflection point found, falling back to relay tuning",
+                self.room_name,
+            )
+            self.active = False
+            return None
+
+        if self._moved_at is None and current_temp - self._start_temp > MOVE_THRESHOLD:
+            self._moved_at = elapsed
+
+        window = self._window
+        window.append((now, current_temp))
+        while len(window) > 2 and now - window[1][0] >= _SLOPE_WINDOW_S:
+            window.popleft()
+
+        oldest_time, oldest_temp = window[0]
+        span = now - oldest_time
+        if span < _SLOPE_WINDOW_S / 2:
+            return None
+        slope = (current_temp - oldest_temp) / span
+
+        if slope > self._max_slope:
+            self._max_slope = slope
+            self._inflection_time = elapsed
+            self._inflection_temp = current_temp
+            self._declining = 0
+            return None
+
+        if self._max_slope < MIN_INFLECTION_SLOPE:
+            return None
+
+        self._declining += 1
+        if self._declining < INFLECTION_CONFIRM_SAMPLES:
+            return None
+
+        self.result = self._calculate_pid_parameters()
+        self.active = False
+        return self.result
+
+    def _calculate_pid_parameters(self) -> tuple[float, float, float]:
+        """Calculate PID parameters from the detected inflection point."""
+        slope = self._max_slope
+
+        # Tangent through the inflection point crosses the start temperature
+        # at the end of the apparent dead time
+        dead_time = self._inflection_time - (
+            (self._inflection_temp - self._start_temp) / slope
+        )
+        if dead_time < MIN_DEAD_TIME:
+            dead_time = max(MIN_DEAD_TIME, self._moved_at or 0.0)
+
+        reaction_rate = slope / STEP_AMPLITUDE
+        kp = 1.2 / (reaction_rate * dead_time)
+        kp, ki, kd = _clamp_gains(kp, kp / (2.0 * dead_time), kp * 0.5 * dead_time)
+
+        _LOGGER.info(
+            "Room %s: PID inflection tuning complete - "
+            "R=%.5f°C/s, L=%.1fs, Kp=%.3f, Ki=%.4f, Kd=%.3f",
+            self.room_name,
+            reaction_rate,
+            dead_time,
+            kp,
+            ki,
+            kd,
+        )
+        return (kp, ki, kd)
+
+
 class PIDAutoTuner:
     """Auto-tuning manager for PID parameters."""
 
     def __init__(self, room_name: str) -> None:
         """Initialize auto-tuner."""
         self.state = PIDTuningState(room_name=room_name)
+        self.inflection = InflectionPIDTuner(room_name)
 
     def start_tuning(self) -> None:
         """Start auto-tuning process."""
         self.state.start_tuning()
+        self.inflection.start()
 
     def stop_tuning(self) -> None:
         """Stop auto-tuning process."""
+        self.inflection.stop()
         self.state.stop_tuning()
 
     def is_tuning_active(self) -> bool:
@@ -316,11 +550,19 @@ class PIDAutoTuner:
         Returns:
             Tuned PID parameters (Kp, Ki, Kd) if tuning complete, None otherwise
         """
-        if self.state.update_with_temperature(current_temp):
-            # Tuning complete
-            self.state.stop_tuning()
-            return self.state.get_tuned_parameters()
-        return None
+        if not self.is_tuning_active():
+            return None
+
+        # Inflection point method is faster; relay oscillation is the fallback
+        params = self.inflection.update(current_temp)
+        if params is not None:
+            self.state.complete_with_parameters(*params)
+        elif not self.state.update_with_temperature(current_temp):
+            return None
+
+        # Tuning complete
+        self.stop_tuning()
+        return self.state.get_tuned_parameters()
 
     def get_tuned_parameters(self) -> tuple[float, float, float] | None:
         """Get tuned parameters if available."""
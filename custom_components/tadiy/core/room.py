@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from typing import Any
 
@@ -20,16 +20,21 @@ from ..const import (
 )
 from .window import WindowState
 
+_MISSING = object()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RoomConfig:
-    """Configuration for a room."""
+    """Configuration for a room.
+
+    Immutable and hashable; list inputs are stored as tuples.
+    """
 
     name: str
-    trv_entity_ids: list[str]
+    trv_entity_ids: tuple[str, ...]
     main_temp_sensor_id: str
     humidity_sensor_id: str = ""
-    window_sensor_ids: list[str] = field(default_factory=list)
+    window_sensor_ids: tuple[str, ...] = ()
     outdoor_sensor_id: str = ""
     weather_entity_id: str = ""
     window_open_timeout: int = DEFAULT_WINDOW_OPEN_TIMEOUT
@@ -60,12 +65,12 @@ class RoomConfig:
     use_hvac_off_for_low_temp: bool = (
         False  # Use HVAC off instead of low temp to stop heating
     )
-    trv_hvac_modes: list[str] | None = (
+    trv_hvac_modes: tuple[str, ...] | None = (
         None  # Explicit HVAC modes for TRV (None = auto-detect from device)
     )
     use_weather_prediction: bool = False  # Weather-based predictive heating
     use_room_coupling: bool = False  # Multi-room heat coupling
-    adjacent_rooms: list[str] = field(default_factory=list)  # Names of adjacent rooms
+    adjacent_rooms: tuple[str, ...] = ()  # Names of adjacent rooms
     coupling_strength: float = 0.5  # Heat coupling factor (0.0-1.0)
     away_temperature: float = DEFAULT_AWAY_TEMPERATURE  # Per-room away mode temperature
     trv_min_temp: float = DEFAULT_TRV_MIN_TEMP  # TRV hardware minimum temperature
@@ -76,6 +81,11 @@ class RoomConfig:
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
+        for name in _ROOM_CONFIG_SEQUENCES:
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
         if not self.name:
             raise ValueError("Room name cannot be empty")
         if not self.trv_entity_ids:
@@ -92,89 +102,41 @@ class RoomConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "name": self.name,
-            "trv_entity_ids": self.trv_entity_ids,
-            "main_temp_sensor_id": self.main_temp_sensor_id,
-            "humidity_sensor_id": self.humidity_sensor_id,
-            "window_sensor_ids": self.window_sensor_ids,
-            "outdoor_sensor_id": self.outdoor_sensor_id,
-            "weather_entity_id": self.weather_entity_id,
-            "window_open_timeout": self.window_open_timeout,
-            "window_close_timeout": self.window_close_timeout,
-            "dont_heat_below_outdoor": self.dont_heat_below_outdoor,
-            "use_early_start": self.use_early_start,
-            "learn_heating_rate": self.learn_heating_rate,
-            "early_start_offset": self.early_start_offset,
-            "early_start_max": self.early_start_max,
-            "override_timeout": self.override_timeout,
-            "hysteresis": self.hysteresis,
-            "target_temp_step": self.target_temp_step,
-            "use_pid_control": self.use_pid_control,
-            "pid_kp": self.pid_kp,
-            "pid_ki": self.pid_ki,
-            "pid_kd": self.pid_kd,
-            "use_heating_curve": self.use_heating_curve,
-            "heating_curve_slope": self.heating_curve_slope,
-            "use_humidity_compensation": self.use_humidity_compensation,
-            "use_hvac_off_for_low_temp": self.use_hvac_off_for_low_temp,
-            "trv_hvac_modes": self.trv_hvac_modes,
-            "use_weather_prediction": self.use_weather_prediction,
-            "use_room_coupling": self.use_room_coupling,
-            "adjacent_rooms": self.adjacent_rooms,
-            "coupling_strength": self.coupling_strength,
-            "away_temperature": self.away_temperature,
-            "trv_min_temp": self.trv_min_temp,
-            "trv_max_temp": self.trv_max_temp,
-            "disable_valve_protection": self.disable_valve_protection,
-        }
+        return {name: getattr(self, name) for name in _ROOM_CONFIG_FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RoomConfig:
         """Create from dictionary."""
-        return cls(
-            name=data["name"],
-            trv_entity_ids=data["trv_entity_ids"],
-            main_temp_sensor_id=data["main_temp_sensor_id"],
-            humidity_sensor_id=data.get("humidity_sensor_id", ""),
-            window_sensor_ids=data.get("window_sensor_ids", []),
-            outdoor_sensor_id=data.get("outdoor_sensor_id", ""),
-            weather_entity_id=data.get("weather_entity_id", ""),
-            window_open_timeout=data.get(
-                "window_open_timeout", DEFAULT_WINDOW_OPEN_TIMEOUT
-            ),
-            window_close_timeout=data.get(
-                "window_close_timeout", DEFAULT_WINDOW_CLOSE_TIMEOUT
-            ),
-            dont_heat_below_outdoor=data.get("dont_heat_below_outdoor", 0.0),
-            use_early_start=data.get("use_early_start", True),
-            learn_heating_rate=data.get("learn_heating_rate", True),
-            early_start_offset=data.get("early_start_offset"),
-            early_start_max=data.get("early_start_max"),
-            override_timeout=data.get("override_timeout"),
-            hysteresis=data.get("hysteresis", 0.3),
-            target_temp_step=data.get("target_temp_step", 0.5),
-            use_pid_control=data.get("use_pid_control", False),
-            pid_kp=data.get("pid_kp", 0.5),
-            pid_ki=data.get("pid_ki", 0.01),
-            pid_kd=data.get("pid_kd", 0.1),
-            use_heating_curve=data.get("use_heating_curve", False),
-            heating_curve_slope=data.get("heating_curve_slope", 0.5),
-            use_humidity_compensation=data.get("use_humidity_compensation", False),
-            use_hvac_off_for_low_temp=data.get("use_hvac_off_for_low_temp", False),
-            trv_hvac_modes=data.get("trv_hvac_modes", None),
-            use_weather_prediction=data.get("use_weather_prediction", False),
-            use_room_coupling=data.get("use_room_coupling", False),
-            adjacent_rooms=data.get("adjacent_rooms", []),
-            coupling_strength=data.get("coupling_strength", 0.5),
-            away_temperature=data.get("away_temperature", DEFAULT_AWAY_TEMPERATURE),
-            trv_min_temp=data.get("trv_min_temp", DEFAULT_TRV_MIN_TEMP),
-            trv_max_temp=data.get("trv_max_temp", DEFAULT_TRV_MAX_TEMP),
-            disable_valve_protection=data.get("disable_valve_protection", False),
-        )
+        kwargs = {name: data[name] for name in _ROOM_CONFIG_REQUIRED}
+        # One lookup per optional field; missing keys keep the field default
+        for name in _ROOM_CONFIG_OPTIONAL:
+            value = data.get(name, _MISSING)
+            if value is not _MISSING:
+                kwargs[name] = value
+        return cls(**kwargs)
+
+
+# Sequence fields of RoomConfig, frozen to tuples on construction
+_ROOM_CONFIG_SEQUENCES = (
+    "trv_entity_ids",
+    "window_sensor_ids",
+    "trv_hvac_modes",
+    "adjacent_rooms",
+)
+
+# Field names of RoomConfig, split by whether from_dict requires them
+_ROOM_CONFIG_FIELDS = tuple(f.name for f in fields(RoomConfig))
+_ROOM_CONFIG_REQUIRED = tuple(
+    f.name
+    for f in fields(RoomConfig)
+    if f.default is MISSING and f.default_factory is MISSING
+)
+_ROOM_CONFIG_OPTIONAL = tuple(
+    name for name in _ROOM_CONFIG_FIELDS if name not in _ROOM_CONFIG_REQUIRED
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomData:
     """Current state data for a room."""
 
@@ -196,8 +158,15 @@ class RoomData:
     override_count: int = 0  # Number of active overrides
     override_active: bool = False  # At least one override active
 
+    # Derived once - RoomData is an immutable per-update snapshot
+    temperature_delta: float | None = field(init=False, repr=False)
+    is_heating_needed: bool = field(init=False, repr=False)
+    trv_temperature_avg: float | None = field(init=False, repr=False)
+    trv_temperature_min: float | None = field(init=False, repr=False)
+    trv_temperature_max: float | None = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
-        """Validate data after initialization."""
+        """Validate data and precompute derived values after initialization."""
         if self.target_temperature is not None:
             if not MIN_TARGET_TEMP <= self.target_temperature <= MAX_TARGET_TEMP:
                 raise ValueError(
@@ -208,25 +177,31 @@ class RoomData:
         if self.heating_rate < 0:
             raise ValueError("Heating rate {} must be >= 0".format(self.heating_rate))
 
+        # Difference between target and current temperature, and whether
+        # the room is below target
+        if self.target_temperature is None:
+            self.temperature_delta = None
+            self.is_heating_needed = False
+        else:
+            self.temperature_delta = self.target_temperature - self.current_temperature
+            self.is_heating_needed = self.temperature_delta > 0
+
+        # TRV aggregates, read by the diagnostic sensor on every state write
+        trv_temps = self.trv_temperatures
+        if trv_temps:
+            self.trv_temperature_avg = sum(trv_temps) / len(trv_temps)
+            self.trv_temperature_min = min(trv_temps)
+            self.trv_temperature_max = max(trv_temps)
+        else:
+            self.trv_temperature_avg = None
+            self.trv_temperature_min = None
+            self.trv_temperature_max = None
+
     @property
     def is_heating_blocked(self) -> bool:
         """Check if heating is blocked by any condition."""
         return self.window_state.heating_should_stop or self.hvac_mode == "off"
 
-    @property
-    def temperature_delta(self) -> float | None:
-        """Get difference between target and current temperature."""
-        if self.target_temperature is None:
-            return None
-        return self.target_temperature - self.current_temperature
-
-    @property
-    def is_heating_needed(self) -> bool:
-        """Check if heating is needed."""
-        if self.target_temperature is None:
-            return False
-        return self.current_temperature < self.target_temperature
-
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -239,7 +214,7 @@ class RoomData:
                 "heating_should_stop": self.window_state.heating_should_stop,
                 "reason": self.window_state.reason,
                 "last_change": (
-                    self.window_state.last_change.isoformat()
+                    self.window_state.last_change.timestamp()
                     if self.window_state.last_change
                     else None
                 ),
@@ -248,7 +223,7 @@ class RoomData:
             "outdoor_temperature": self.outdoor_temperature,
             "target_temperature": self.target_temperature,
             "hvac_mode": self.hvac_mode,
-            "last_update": self.last_update.isoformat(),
+            "last_update": self.last_update.timestamp(),
             "heating_active": self.heating_active,
             "heating_rate": self.heating_rate,
             "is_heating_blocked": self.is_heating_blocked,
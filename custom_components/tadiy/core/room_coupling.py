@@ -8,6 +8,8 @@ slightly to account for heat transfer through shared walls.
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,23 +21,26 @@ MAX_COUPLING_REDUCTION = 1.5  # Maximum temperature reduction from coupling
 NEIGHBOR_HEATING_THRESHOLD = 0.5  # °C above target to be considered "actively heating"
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomCouplingState:
     """State of heat coupling for a room."""
 
     room_name: str
-    adjacent_rooms: list[str] = field(default_factory=list)
+    adjacent_rooms: frozenset[str] = frozenset()
     coupling_strength: float = 0.5  # 0.0 - 1.0
-    neighbors_heating: list[str] = field(default_factory=list)
+    neighbors_heating: set[str] = field(default_factory=set)
     coupling_adjustment: float = 0.0
+    # Set when neighbors_heating changes; coupling_adjustment is stale until
+    # the next get_coupling_adjustment call
+    _coupling_dirty: bool = field(default=True, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
             "room_name": self.room_name,
-            "adjacent_rooms": self.adjacent_rooms,
+            "adjacent_rooms": sorted(self.adjacent_rooms),
             "coupling_strength": self.coupling_strength,
-            "neighbors_heating": self.neighbors_heating,
+            "neighbors_heating": sorted(self.neighbors_heating),
             "coupling_adjustment": self.coupling_adjustment,
         }
 
@@ -43,10 +48,12 @@ class RoomCouplingState:
     def from_dict(cls, data: dict[str, Any]) -> RoomCouplingState:
         """Create from dictionary."""
         return cls(
-            room_name=data["room_name"],
-            adjacent_rooms=data.get("adjacent_rooms", []),
+            room_name=sys.intern(data["room_name"]),
+            adjacent_rooms=frozenset(
+                sys.intern(name) for name in data.get("adjacent_rooms", [])
+            ),
             coupling_strength=data.get("coupling_strength", 0.5),
-            neighbors_heating=data.get("neighbors_heating", []),
+            neighbors_heating=set(data.get("neighbors_heating", [])),
             coupling_adjustment=data.get("coupling_adjustment", 0.0),
         )
 
@@ -62,11 +69,34 @@ class RoomCouplingManager:
     def __init__(self) -> None:
         """Initialize the coupling manager."""
         self._room_states: dict[str, RoomCouplingState] = {}
+        # Reverse index: room -> rooms that list it as an adjacent room
+        self._neighbors_of: dict[str, set[str]] = {}
+        # Bumped on every state change; to_dict() reuses its last result
+        # while the version is unchanged
+        self._version = 0
+        self._dict_cache: dict[str, Any] | None = None
+        self._dict_cache_version = -1
+        self._snapshot_cache: dict[str, dict[str, Any]] | None = None
+        self._snapshot_cache_version = -1
+
+    def _index_room(self, state: RoomCouplingState) -> None:
+        """Add a room's adjacency to the reverse index."""
+        for neighbor in state.adjacent_rooms:
+            self._neighbors_of.setdefault(neighbor, set()).add(state.room_name)
+
+    def _unindex_room(self, state: RoomCouplingState) -> None:
+        """Remove a room's adjacency from the reverse index."""
+        for neighbor in state.adjacent_rooms:
+            listed_by = self._neighbors_of.get(neighbor)
+            if listed_by is not None:
+                listed_by.discard(state.room_name)
+                if not listed_by:
+                    del self._neighbors_of[neighbor]
 
     def register_room(
         self,
         room_name: str,
-        adjacent_rooms: list[str],
+        adjacent_rooms: Iterable[str],
         coupling_strength: float = 0.5,
     ) -> None:
         """
@@ -74,20 +104,30 @@ class RoomCouplingManager:
 
         Args:
             room_name: Name of the room
-            adjacent_rooms: List of adjacent room names
+            adjacent_rooms: Names of adjacent rooms
             coupling_strength: How much to adjust for coupling (0.0-1.0)
         """
-        self._room_states[room_name] = RoomCouplingState(
+        previous = self._room_states.get(room_name)
+        if previous is not None:
+            self._unindex_room(previous)
+
+        # Interned names make the neighbor set and index lookups identity hits
+        room_name = sys.intern(room_name)
+        state = RoomCouplingState(
             room_name=room_name,
-            adjacent_rooms=adjacent_rooms,
+            adjacent_rooms=frozenset(sys.intern(name) for name in adjacent_rooms),
             coupling_strength=coupling_strength,
         )
-        _LOGGER.debug(
-            "Registered room %s for coupling with neighbors: %s (strength: %.1f)",
-            room_name,
-            adjacent_rooms,
-            coupling_strength,
-        )
+        self._room_states[room_name] = state
+        self._index_room(state)
+        self._version += 1
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Registered room %s for coupling with neighbors: %s (strength: %.1f)",
+                room_name,
+                state.adjacent_rooms,
+                coupling_strength,
+            )
 
     def update_room_heating_status(
         self,
@@ -114,13 +154,21 @@ class RoomCouplingManager:
             delta = target_temp - current_temp
             actively_heating = delta > NEIGHBOR_HEATING_THRESHOLD
 
-        # Update all rooms that have this room as a neighbor
-        for state in self._room_states.values():
-            if room_name in state.adjacent_rooms:
-                if actively_heating and room_name not in state.neighbors_heating:
-                    state.neighbors_heating.append(room_name)
-                elif not actively_heating and room_name in state.neighbors_heating:
-                    state.neighbors_heating.remove(room_name)
+        # Update only the rooms that have this room as a neighbor
+        for affected in self._neighbors_of.get(room_name, ()):
+            state = self._room_states.get(affected)
+            if state is None:
+                continue
+            neighbors_heating = state.neighbors_heating
+            if actively_heating:
+                if room_name not in neighbors_heating:
+                    neighbors_heating.add(room_name)
+                    state._coupling_dirty = True
+                    self._version += 1
+            elif room_name in neighbors_heating:
+                neighbors_heating.discard(room_name)
+                state._coupling_dirty = True
+                self._version += 1
 
     def get_coupling_adjustment(self, room_name: str) -> float:
         """
@@ -136,20 +184,25 @@ class RoomCouplingManager:
         if not state or not state.neighbors_heating:
             return 0.0
 
-        # Calculate adjustment based on number of heating neighbors and strength
-        neighbor_count = len(state.neighbors_heating)
-        base_reduction = DEFAULT_COUPLING_REDUCTION * neighbor_count
-
-        # Apply coupling strength
-        adjusted_reduction = base_reduction * state.coupling_strength
-
-        # Cap at maximum
-        final_reduction = min(adjusted_reduction, MAX_COUPLING_REDUCTION)
+        # Reuse the last result until the set of heating neighbors changes
+        if not state._coupling_dirty:
+            return state.coupling_adjustment
+
+        # Calculate adjustment based on number of heating neighbors and strength,
+        # capped at maximum
+        final_reduction = min(
+            DEFAULT_COUPLING_REDUCTION
+            * len(state.neighbors_heating)
+            * state.coupling_strength,
+            MAX_COUPLING_REDUCTION,
+        )
 
-        # Store for diagnostics
+        # Store for diagnostics and later calls
         state.coupling_adjustment = -final_reduction
+        state._coupling_dirty = False
+        self._version += 1
 
-        if final_reduction > 0:
+        if final_reduction > 0 and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Room %s: Coupling adjustment: -%.1f°C (neighbors heating: %s)",
                 room_name,
@@ -159,6 +212,23 @@ class RoomCouplingManager:
 
         return -final_reduction  # Negative = reduce target
 
+    def get_all_coupling_adjustments(self) -> dict[str, float]:
+        """
+        Get the coupling adjustment for every registered room in one pass.
+
+        Returns:
+            Mapping of room name to temperature adjustment (negative = reduce)
+        """
+        adjustments = {}
+        for room_name, state in self._room_states.items():
+            if not state.neighbors_heating:
+                adjustments[room_name] = 0.0
+            elif state._coupling_dirty:
+                adjustments[room_name] = self.get_coupling_adjustment(room_name)
+            else:
+                adjustments[room_name] = state.coupling_adjustment
+        return adjustments
+
     def get_room_state(self, room_name: str) -> RoomCouplingState | None:
         """Get current coupling state for a room."""
         return self._room_states.get(room_name)
@@ -167,30 +237,72 @@ class RoomCouplingManager:
         """Get all room coupling states."""
         return self._room_states.copy()
 
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get a read-only view of all room coupling states.
+
+        Sequences are returned as sorted tuples, so consumers can iterate
+        them without copying while the live sets keep changing. The result
+        is reused until the next state change.
+
+        Returns:
+            Mapping of room name to its coupling state
+        """
+        if (
+            self._snapshot_cache is None
+            or self._snapshot_cache_version != self._version
+        ):
+            self._snapshot_cache = {
+                name: {
+                    "adjacent_rooms": tuple(sorted(state.adjacent_rooms)),
+                    "coupling_strength": state.coupling_strength,
+                    "neighbors_heating": tuple(sorted(state.neighbors_heating)),
+                    "coupling_adjustment": state.coupling_adjustment,
+                }
+                for name, state in self._room_states.items()
+            }
+            self._snapshot_cache_version = self._version
+        return self._snapshot_cache
+
     def unregister_room(self, room_name: str) -> None:
         """Remove a room from coupling calculations."""
-        if room_name in self._room_states:
-            del self._room_states[room_name]
-
-        # Also remove from neighbors lists
-        for state in self._room_states.values():
-            if room_name in state.adjacent_rooms:
-                state.adjacent_rooms.remove(room_name)
+        removed = self._room_states.pop(room_name, None)
+        if removed is not None:
+            self._unindex_room(removed)
+            self._version += 1
+
+        # Also remove from the neighbor lists of rooms that listed it
+        for affected in self._neighbors_of.pop(room_name, ()):
+            state = self._room_states.get(affected)
+            if state is None:
+                continue
+            state.adjacent_rooms = state.adjacent_rooms - {room_name}
             if room_name in state.neighbors_heating:
-                state.neighbors_heating.remove(room_name)
+                state.neighbors_heating.discard(room_name)
+                state._coupling_dirty = True
+            self._version += 1
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage."""
-        return {
-            "room_states": {
-                name: state.to_dict() for name, state in self._room_states.items()
+        """Convert to dictionary for storage.
+
+        The result is cached until the next state change; callers must not
+        mutate it.
+        """
+        if self._dict_cache is None or self._dict_cache_version != self._version:
+            self._dict_cache = {
+                "room_states": {
+                    name: state.to_dict() for name, state in self._room_states.items()
+                }
             }
-        }
+            self._dict_cache_version = self._version
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RoomCouplingManager:
         """Create from dictionary."""
         manager = cls()
         for name, state_data in data.get("room_states", {}).items():
-            manager._room_states[name] = RoomCouplingState.from_dict(state_data)
+            state = RoomCouplingState.from_dict(state_data)
+            manager._room_states[name] = state
+            manager._index_room(state)
         return manager
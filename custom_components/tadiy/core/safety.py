@@ -10,6 +10,8 @@ Provides three independent safety checks:
 from __future__ import annotations
 
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -23,9 +25,10 @@ OVERHEAT_TEMP: float = 28.0  # Force heating off above this
 FROST_FLOOR_TEMP: float = 5.0  # Force heating on below this
 VALVE_STUCK_TIMEOUT: int = 1800  # 30 min without temp change after command
 VALVE_STUCK_MIN_DELTA: float = 0.3  # Expected min change in that period
+MAX_STORED_ALERTS: int = 64  # Oldest alerts are dropped beyond this
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyAlert:
     """A safety alert."""
 
@@ -35,14 +38,16 @@ class SafetyAlert:
     resolved: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyState:
     """Safety state for a room."""
 
     overheat_active: bool = False
     frost_active: bool = False
     valve_stuck: bool = False
-    alerts: list[SafetyAlert] = field(default_factory=list)
+    alerts: deque[SafetyAlert] = field(
+        default_factory=lambda: deque(maxlen=MAX_STORED_ALERTS)
+    )
 
     @property
     def any_alert(self) -> bool:
@@ -59,12 +64,20 @@ class SafetyManager:
         self._debug_fn = debug_callback
         self.state = SafetyState()
 
-        # Valve stuck tracking
-        self._last_command_time: datetime | None = None
+        # Valve stuck tracking (monotonic seconds, immune to wall-clock jumps)
+        self._last_command_time: float | None = None
         self._temp_at_command: float | None = None
+        # True from a TRV command until the valve is seen working
+        self._armed = False
 
     def _debug(self, message: str, *args) -> None:
-        """Log debug message."""
+        """Log debug message.
+
+        The debug callback logs below the same package logger, so nothing is
+        dispatched while DEBUG is disabled.
+        """
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
         if self._debug_fn:
             self._debug_fn("rooms", message, args)
         else:
@@ -142,8 +155,9 @@ class SafetyManager:
 
     def on_trv_command_sent(self, current_temp: float | None) -> None:
         """Record that we just sent a command to the TRV."""
-        self._last_command_time = dt_util.utcnow()
+        self._last_command_time = time.monotonic()
         self._temp_at_command = current_temp
+        self._armed = True
 
     def check_valve_stuck(
         self, current_temp: float | None, heating_active: bool
@@ -152,16 +166,21 @@ class SafetyManager:
 
         Only checks when heating is supposed to be active.
         """
+        # Nothing to judge without a pending command; valve_stuck is already
+        # False then since it is only set while armed
+        if not self._armed:
+            return False
+
         if (
-            not heating_active
+            self._last_command_time is None
+            or not heating_active
             or current_temp is None
-            or self._last_command_time is None
             or self._temp_at_command is None
         ):
             self.state.valve_stuck = False
             return False
 
-        elapsed = (dt_util.utcnow() - self._last_command_time).total_seconds()
+        elapsed = time.monotonic() - self._last_command_time
         if elapsed < VALVE_STUCK_TIMEOUT:
             return False  # Too early to judge
 
@@ -190,6 +209,7 @@ class SafetyManager:
         # Temp is changing — valve is working
         self.state.valve_stuck = False
         self._last_command_time = None  # Reset for next check
+        self._armed = False
         return False
 
     def get_active_alerts(self) -> list[str]:
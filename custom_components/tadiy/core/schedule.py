@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 from typing import Any, Callable
 
 from homeassistant.util import dt as dt_util
 
 from ..const import DEFAULT_FROST_PROTECTION_TEMP, MODE_MANUAL, MODE_OFF
-from .schedule_model import RoomSchedule
+from .schedule_model import DaySchedule, RoomSchedule
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modes without a schedule; built once instead of a tuple per call
+_UNSCHEDULED_MODES: frozenset[str] = frozenset((MODE_MANUAL, MODE_OFF))
+
 
 class ScheduleEngine:
     """Engine for calculating target temperatures based on schedules and mode."""
@@ -31,10 +36,35 @@ class ScheduleEngine:
         self._frost_protection_temp = frost_protection_temp
         self._room_schedules: dict[str, RoomSchedule] = {}
         self._debug_callback = debug_callback
+        # (room, mode, is_weekday) -> (day schedule, source, resolved block
+        # temperatures); cleared on any schedule change
+        self._day_cache: dict[
+            tuple[str, str, bool], tuple[DaySchedule, str, list[float]]
+        ] = {}
+        # (room, mode, is_weekday) -> day schedule the room defines for that
+        # mode and day type, or None; cleared on any schedule change
+        self._resolved_days: dict[tuple[str, str, bool], DaySchedule | None] = {}
+        # (room, mode, is_weekday, next block index) -> (date ordinal, tzinfo,
+        # next change); reused while the lookup stays on the same day
+        self._next_change_cache: dict[
+            tuple[str, str, bool, int], tuple[int, Any, tuple[datetime, float]]
+        ] = {}
+        # Time pinned by prepare_tick() for calls that omit dt
+        self._tick_dt: datetime | None = None
+        self._tick_weekday = 0
+        self._tick_minutes = 0
+
+    def _debug_enabled(self) -> bool:
+        """Check if a debug message would be emitted.
+
+        The debug callback logs below the same package logger, so a disabled
+        DEBUG level here means the message would be dropped anyway.
+        """
+        return self._debug_callback is not None and _LOGGER.isEnabledFor(logging.DEBUG)
 
     def _debug(self, message: str, *args: Any) -> None:
         """Log debug message if callback is set."""
-        if self._debug_callback:
+        if self._debug_enabled():
             self._debug_callback("schedule", message, args)
 
     def set_debug_callback(
@@ -45,16 +75,45 @@ class ScheduleEngine:
 
     def set_frost_protection_temp(self, temp: float) -> None:
         """Set frost protection temperature."""
-        self._frost_protection_temp = temp
+        if temp != self._frost_protection_temp:
+            self._frost_protection_temp = temp
+            self._day_cache.clear()
+            self._next_change_cache.clear()
+            self._resolved_days.clear()
 
     def update_room_schedule(self, room_name: str, schedule: RoomSchedule) -> None:
-        """Update schedule for a room."""
+        """Update schedule for a room.
+
+        Must also be called after modifying a stored RoomSchedule in place.
+        """
+        schedule.clear_mode_index()
         self._room_schedules[room_name] = schedule
+        self._day_cache.clear()
+        self._next_change_cache.clear()
+        self._resolved_days.clear()
 
     def remove_room_schedule(self, room_name: str) -> None:
         """Remove schedule for a room."""
         if room_name in self._room_schedules:
             del self._room_schedules[room_name]
+            self._day_cache.clear()
+            self._next_change_cache.clear()
+            self._resolved_days.clear()
+
+    def prepare_tick(self, dt: datetime | None = None) -> None:
+        """Pin the time used by get_target_temperature calls that omit dt.
+
+        Called once per coordinator update so repeated lookups in the same
+        cycle share a single timestamp instead of each calling dt_util.now().
+
+        Args:
+            dt: Datetime of this update cycle (defaults to now)
+        """
+        if dt is None:
+            dt = dt_util.now()
+        self._tick_dt = dt
+        self._tick_weekday = dt.weekday()
+        self._tick_minutes = dt.hour * 60 + dt.minute
 
     def get_target_temperature(
         self,
@@ -69,89 +128,193 @@ class ScheduleEngine:
         Args:
             room_name: Name of the room
             mode: Current hub mode (normal|homeoffice|manual|off)
-            dt: Datetime to check (defaults to now)
+            dt: Datetime to check (defaults to the prepare_tick() time, or now)
             friday_weekend_start_hour: Hour on Friday to switch to weekend schedule
 
         Returns:
             Target temperature in C, or None if manual mode or no schedule
         """
-        if dt is None:
-            dt = dt_util.now()
+        if dt is None and self._tick_dt is not None:
+            dt = self._tick_dt
+            weekday = self._tick_weekday
+            minutes = self._tick_minutes
+        else:
+            if dt is None:
+                dt = dt_util.now()
+            weekday = dt.weekday()
+            minutes = dt.hour * 60 + dt.minute
 
         # Manual mode: Don't provide scheduled temperature
         if mode == MODE_MANUAL:
-            self._debug("Manual mode active - no scheduled temperature")
+            if self._debug_enabled():
+                self._debug("Manual mode active - no scheduled temperature")
             return None
 
         # Off mode: Always frost protection
         if mode == MODE_OFF:
-            self._debug(
-                "Off mode active - using frost protection %.1f",
-                self._frost_protection_temp,
-            )
+            if self._debug_enabled():
+                self._debug(
+                    "Off mode active - using frost protection %.1f",
+                    self._frost_protection_temp,
+                )
             return self._frost_protection_temp
 
         # Normal or Homeoffice: Use schedules
         room_schedule = self._room_schedules.get(room_name)
         if not room_schedule:
-            self._debug("No schedule found for room")
+            if self._debug_enabled():
+                self._debug("No schedule found for room")
             return None
 
         # Calculate weekday/weekend dynamically considering early Friday transition
-        is_friday_weekend = dt.weekday() == 4 and dt.hour >= friday_weekend_start_hour
-        is_weekday = dt.weekday() < 5 and not is_friday_weekend
-        current_time = dt.time()
-
-        day_schedule = room_schedule.get_schedule_for_mode(
-            mode, dt, friday_weekend_start_hour
-        )
-        schedule_source = mode
-
-        if not day_schedule:
-            # Custom mode without own schedule: Fall back to normal schedule
-            day_schedule = room_schedule.get_schedule_for_mode(
-                "normal", dt, friday_weekend_start_hour
+        is_friday_weekend = weekday == 4 and dt.hour >= friday_weekend_start_hour
+        is_weekday = weekday < 5 and not is_friday_weekend
+
+        cache_key = (room_name, mode, is_weekday)
+        cached = self._day_cache.get(cache_key)
+        if cached is None:
+            day_schedule = self._resolve_day_schedule(
+                room_name,
+                room_schedule,
+                mode,
+                is_weekday,
+                dt,
+                friday_weekend_start_hour,
             )
-            schedule_source = "normal (fallback)"
+            schedule_source = mode
+
             if not day_schedule:
-                self._debug("No schedule for mode %s or normal fallback", mode)
-                return None
+                # Custom mode without own schedule: Fall back to normal schedule
+                day_schedule = self._resolve_day_schedule(
+                    room_name,
+                    room_schedule,
+                    "normal",
+                    is_weekday,
+                    dt,
+                    friday_weekend_start_hour,
+                )
+                schedule_source = "normal (fallback)"
+                if not day_schedule:
+                    if self._debug_enabled():
+                        self._debug("No schedule for mode %s or normal fallback", mode)
+                    return None
+
+            if not day_schedule.blocks:
+                # Nothing to cache; get_temperature warns and uses frost
+                return day_schedule.get_temperature_by_minutes(
+                    minutes, self._frost_protection_temp
+                )
+
+            cached = self._build_day_cache(day_schedule, schedule_source)
+            self._day_cache[cache_key] = cached
+
+        day_schedule, schedule_source, temps = cached
+        starts = day_schedule.start_minutes
+
+        # Active block is the last one starting at or before now
+        index = max(bisect_right(starts, minutes) - 1, 0)
+        target_temp = temps[index]
+
+        if self._debug_enabled():
+            start = starts[index]
+            end = starts[index + 1] if index + 1 < len(starts) else 1440
+            self._debug(
+                "Active block: %02d:%02d-%02d:%02d -> %.1f (%s, %s)",
+                start // 60,
+                start % 60,
+                end // 60,
+                end % 60,
+                target_temp,
+                schedule_source,
+                "weekday" if is_weekday else "weekend",
+            )
 
-        target_temp = day_schedule.get_temperature(
-            current_time, self._frost_protection_temp
-        )
+        return target_temp
 
-        # Find active block info for logging
-        active_block_start = None
-        active_block_end = None
-        for i, block in enumerate(day_schedule.blocks):
-            block_time = block.start_time
-            next_block_time = (
-                day_schedule.blocks[i + 1].start_time
-                if i + 1 < len(day_schedule.blocks)
-                else None
-            )
+    def get_target_temperatures(
+        self,
+        room_names: Iterable[str],
+        mode: str,
+        dt: datetime | None = None,
+        friday_weekend_start_hour: int = 24,
+    ) -> dict[str, float | None]:
+        """
+        Get target temperatures for several rooms in one pass.
 
-            if block_time <= current_time:
-                if next_block_time is None or current_time < next_block_time:
-                    active_block_start = block_time.strftime("%H:%M")
-                    active_block_end = (
-                        next_block_time.strftime("%H:%M")
-                        if next_block_time
-                        else "24:00"
-                    )
-                    break
-
-        self._debug(
-            "Active block: %s-%s -> %.1f (%s, %s)",
-            active_block_start or "00:00",
-            active_block_end or "24:00",
-            target_temp,
-            schedule_source,
-            "weekday" if is_weekday else "weekend",
+        The time and weekday/weekend split are resolved once for all rooms.
+        Rooms whose day schedule is already cached are looked up directly,
+        the rest go through get_target_temperature.
+
+        Args:
+            room_names: Names of the rooms
+            mode: Current hub mode (normal|homeoffice|manual|off)
+            dt: Datetime to check (defaults to the prepare_tick() time, or now)
+            friday_weekend_start_hour: Hour on Friday to switch to weekend schedule
+
+        Returns:
+            Mapping of room name to target temperature (None as in
+            get_target_temperature)
+        """
+        if dt is None:
+            dt = self._tick_dt if self._tick_dt is not None else dt_util.now()
+
+        # Unscheduled modes and debug output need the per-room path
+        if mode in _UNSCHEDULED_MODES or self._debug_enabled():
+            return {
+                room_name: self.get_target_temperature(
+                    room_name, mode, dt, friday_weekend_start_hour
+                )
+                for room_name in room_names
+            }
+
+        weekday = dt.weekday()
+        is_weekday = weekday < 5 and not (
+            weekday == 4 and dt.hour >= friday_weekend_start_hour
         )
+        minutes = dt.hour * 60 + dt.minute
+        day_cache = self._day_cache
+
+        targets: dict[str, float | None] = {}
+        for room_name in room_names:
+            cached = day_cache.get((room_name, mode, is_weekday))
+            if cached is None:
+                targets[room_name] = self.get_target_temperature(
+                    room_name, mode, dt, friday_weekend_start_hour
+                )
+                continue
+            day_schedule, _, temps = cached
+            index = bisect_right(day_schedule.start_minutes, minutes) - 1
+            targets[room_name] = temps[max(index, 0)]
+        return targets
+
+    def _resolve_day_schedule(
+        self,
+        room_name: str,
+        room_schedule: RoomSchedule,
+        mode: str,
+        is_weekday: bool,
+        dt: datetime,
+        friday_weekend_start_hour: int,
+    ) -> DaySchedule | None:
+        """Get the room's day schedule for a mode, memoized per day type."""
+        key = (room_name, mode, is_weekday)
+        try:
+            return self._resolved_days[key]
+        except KeyError:
+            pass
+        day_schedule = room_schedule.get_schedule_for_mode(
+            mode, dt, friday_weekend_start_hour
+        )
+        self._resolved_days[key] = day_schedule
+        return day_schedule
 
-        return target_temp
+    def _build_day_cache(
+        self, day_schedule: DaySchedule, schedule_source: str
+    ) -> tuple[DaySchedule, str, list[float]]:
+        """Precompute resolved block temperatures."""
+        frost = self._frost_protection_temp
+        temps = [frost if temp is None else temp for temp in day_schedule.block_temps]
+        return (day_schedule, schedule_source, temps)
 
     def get_next_schedule_change(
         self,
@@ -175,29 +338,44 @@ class ScheduleEngine:
         if dt is None:
             dt = dt_util.now()
 
-        if mode in (MODE_MANUAL, MODE_OFF):
+        if mode in _UNSCHEDULED_MODES:
             return None
 
         room_schedule = self._room_schedules.get(room_name)
         if not room_schedule:
             return None
 
-        day_schedule = room_schedule.get_schedule_for_mode(
-            mode, dt, friday_weekend_start_hour
+        weekday = dt.weekday()
+        is_weekday = weekday < 5 and not (
+            weekday == 4 and dt.hour >= friday_weekend_start_hour
+        )
+        day_schedule = self._resolve_day_schedule(
+            room_name, room_schedule, mode, is_weekday, dt, friday_weekend_start_hour
         )
         if not day_schedule:
             return None
 
-        current_time = dt.time()
-        next_change = day_schedule.get_next_change(current_time)
-
-        if not next_change:
+        blocks = day_schedule.blocks
+        if not blocks:
             return None
 
-        next_time, next_temp = next_change
+        # Next block starting after the current minute, else first block tomorrow
+        index = bisect_right(day_schedule.start_minutes, dt.hour * 60 + dt.minute)
+
+        # Same day and block index means the same next change; skip rebuilding it
+        cache_key = (room_name, mode, is_weekday, index)
+        day = dt.toordinal()
+        cached = self._next_change_cache.get(cache_key)
+        if cached is not None and cached[0] == day and cached[1] is dt.tzinfo:
+            return cached[2]
+
+        same_day = index < len(blocks)
+        next_block = blocks[index] if same_day else blocks[0]
+        next_time = next_block.start_time
+        next_temp = next_block.temperature
 
         # Calculate next datetime
-        if next_time > current_time:
+        if same_day:
             # Same day
             next_dt = dt.replace(
                 hour=next_time.hour,
@@ -207,8 +385,6 @@ class ScheduleEngine:
             )
         else:
             # Next day
-            from datetime import timedelta
-
             next_dt = dt + timedelta(days=1)
             next_dt = next_dt.replace(
                 hour=next_time.hour,
@@ -221,25 +397,30 @@ class ScheduleEngine:
         if isinstance(next_temp, str):
             next_temp = self._frost_protection_temp
 
-        self._debug(
-            "Next change: %s -> %.1f",
-            next_dt.strftime("%H:%M"),
-            float(next_temp),
-        )
+        next_temp = float(next_temp)
+        if self._debug_enabled():
+            self._debug("Next change: %s -> %.1f", next_dt.strftime("%H:%M"), next_temp)
 
-        return (next_dt, float(next_temp))
+        result = (next_dt, next_temp)
+        self._next_change_cache[cache_key] = (day, dt.tzinfo, result)
+        return result
 
     def is_schedule_active(self, room_name: str, mode: str) -> bool:
         """Check if schedule is active for room in current mode."""
-        if mode in (MODE_MANUAL, MODE_OFF):
+        if mode in _UNSCHEDULED_MODES:
             return False
 
         room_schedule = self._room_schedules.get(room_name)
         if not room_schedule:
             return False
 
-        day_schedule = room_schedule.get_schedule_for_mode(mode)
+        # One timestamp for both lookups, shared with the current tick if any
+        dt = self._tick_dt if self._tick_dt is not None else dt_util.now()
+        weekday = dt.weekday()
+        day_schedule = room_schedule.get_schedule_for_mode(mode, dt, weekday=weekday)
         # Fall back to normal if no custom schedule defined
         if day_schedule is None:
-            day_schedule = room_schedule.get_schedule_for_mode("normal")
+            day_schedule = room_schedule.get_schedule_for_mode(
+                "normal", dt, weekday=weekday
+            )
         return day_schedule is not None and len(day_schedule.blocks) > 0
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from typing import Any
@@ -22,12 +24,14 @@ from ..const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScheduleBlock:
     """A single schedule block with start time and temperature."""
 
     start_time: time
     temperature: float | str
+    # Numeric temperature as float, None for frost/off (use frost protection)
+    _resolved: float | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate schedule block after initialization."""
@@ -44,6 +48,8 @@ class ScheduleBlock:
                     self.temperature, MIN_TARGET_TEMP, MAX_TARGET_TEMP
                 )
             )
+        else:
+            object.__setattr__(self, "_resolved", float(self.temperature))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -60,13 +66,37 @@ class ScheduleBlock:
             temperature=data["temperature"],
         )
 
+    @classmethod
+    def from_dict_trusted(cls, data: dict[str, Any]) -> ScheduleBlock:
+        """Create from a dictionary written by to_dict, skipping validation."""
+        block = object.__new__(cls)
+        temperature = data["temperature"]
+        object.__setattr__(block, "start_time", time.fromisoformat(data["start_time"]))
+        object.__setattr__(block, "temperature", temperature)
+        object.__setattr__(
+            block,
+            "_resolved",
+            None if isinstance(temperature, str) else float(temperature),
+        )
+        return block
 
-@dataclass
+
+@dataclass(slots=True)
 class DaySchedule:
     """Schedule for a single day type (weekday/weekend/daily)."""
 
     schedule_type: str
     blocks: list[ScheduleBlock] = field(default_factory=list)
+    # Block start times as minutes since midnight, parallel to blocks
+    start_minutes: list[int] = field(init=False, repr=False, compare=False)
+    # Resolved block temperatures, None for frost/off (resolved per call)
+    block_temps: list[float | None] = field(init=False, repr=False, compare=False)
+    # Last lookup (minute, frost temp) -> temperature; most calls repeat
+    # the same minute between schedule changes
+    _memo_minutes: int = field(default=-1, init=False, repr=False, compare=False)
+    _memo_frost: float = field(default=0.0, init=False, repr=False, compare=False)
+    _memo_temp: float = field(default=0.0, init=False, repr=False, compare=False)
+    _warned_empty: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate and sort schedule after initialization."""
@@ -77,77 +107,93 @@ class DaySchedule:
         ):
             raise ValueError("Invalid schedule type: {}".format(self.schedule_type))
 
-        # Sort blocks by start time
-        self.blocks.sort(key=lambda b: b.start_time)
+        # Sort blocks by start time; stored and UI-built lists usually are
+        blocks = self.blocks
+        if any(
+            blocks[i + 1].start_time < blocks[i].start_time
+            for i in range(len(blocks) - 1)
+        ):
+            blocks.sort(key=lambda b: b.start_time)
+        self._build_lookup()
 
         # Validate coverage
         self._validate_coverage()
 
+    def _build_lookup(self) -> None:
+        """Build the lookup lists derived from the (sorted) blocks."""
+        self.start_minutes = [
+            b.start_time.hour * 60 + b.start_time.minute for b in self.blocks
+        ]
+        self.block_temps = [b._resolved for b in self.blocks]
+        self._memo_minutes = -1
+        self._memo_frost = 0.0
+        self._memo_temp = 0.0
+        self._warned_empty = False
+
     def _validate_coverage(self) -> None:
-        """Validate that schedule covers full day without gaps."""
+        """Validate that schedule covers full day without gaps.
+
+        Each block runs until the next one starts (the last until midnight),
+        so a schedule starting at 00:00 has no gaps.
+        """
         if not self.blocks:
             return
 
         # Must start at 00:00
-        if self.blocks[0].start_time != time(0, 0):
+        if self.start_minutes[0] != 0:
             raise ValueError("First block must start at 00:00")
 
-        # Check for gaps between blocks
-        for i in range(len(self.blocks) - 1):
-            current_end = self._next_block_time(self.blocks[i].start_time, i)
-            next_start = self.blocks[i + 1].start_time
-
-            if current_end != next_start:
-                raise ValueError(
-                    "Gap detected between {} and {}. Blocks must be continuous.".format(
-                        current_end, next_start
-                    )
-                )
-
-    def _next_block_time(self, current: time, index: int) -> time:
-        """Calculate when the next block should start."""
-        if index < len(self.blocks) - 1:
-            return self.blocks[index + 1].start_time
-        return time(0, 0)
-
     def get_temperature(
         self, current_time: time, frost_protection_temp: float
     ) -> float:
         """Get temperature for given time."""
+        return self.get_temperature_by_minutes(
+            current_time.hour * 60 + current_time.minute, frost_protection_temp
+        )
+
+    def get_temperature_by_minutes(
+        self, minutes: int, frost_protection_temp: float
+    ) -> float:
+        """Get temperature for a time given as minutes since midnight."""
+        if minutes == self._memo_minutes and frost_protection_temp == self._memo_frost:
+            return self._memo_temp
+
         if not self.blocks:
-            # No blocks defined - this is a configuration issue
-            _LOGGER.warning(
-                "Schedule has no blocks defined (type=%s), returning frost protection %.1f",
-                self.schedule_type,
-                frost_protection_temp,
-            )
+            # No blocks defined - this is a configuration issue; warn once
+            # per schedule instead of on every update
+            if not self._warned_empty:
+                self._warned_empty = True
+                _LOGGER.warning(
+                    "Schedule has no blocks defined (type=%s), returning frost protection %.1f",
+                    self.schedule_type,
+                    frost_protection_temp,
+                )
             return frost_protection_temp
 
-        # Find active block
-        active_block = self.blocks[0]
-        for block in self.blocks:
-            if block.start_time <= current_time:
-                active_block = block
-            else:
-                break
+        # Find active block: last one starting at or before current time
+        index = bisect_right(self.start_minutes, minutes)
+        temperature = self.block_temps[index - 1 if index else 0]
 
-        # Resolve special temperatures
-        if isinstance(active_block.temperature, str):
-            if active_block.temperature == SCHEDULE_TEMP_FROST:
-                return frost_protection_temp
-            elif active_block.temperature == SCHEDULE_TEMP_OFF:
-                return frost_protection_temp
+        # Frost and off blocks both resolve to frost protection
+        if temperature is None:
+            temperature = frost_protection_temp
 
-        return float(active_block.temperature)
+        self._memo_minutes = minutes
+        self._memo_frost = frost_protection_temp
+        self._memo_temp = temperature
+        return temperature
 
     def get_next_change(self, current_time: time) -> tuple[time, float | str] | None:
         """Get next schedule change time and temperature."""
         if not self.blocks:
             return None
 
-        for block in self.blocks:
-            if block.start_time > current_time:
-                return (block.start_time, block.temperature)
+        index = bisect_right(
+            self.start_minutes, current_time.hour * 60 + current_time.minute
+        )
+        if index < len(self.blocks):
+            block = self.blocks[index]
+            return (block.start_time, block.temperature)
 
         # No more changes today, next change is first block tomorrow
         return (self.blocks[0].start_time, self.blocks[0].temperature)
@@ -167,8 +213,24 @@ class DaySchedule:
             blocks=[ScheduleBlock.from_dict(b) for b in data.get("blocks", [])],
         )
 
-
-@dataclass
+    @classmethod
+    def from_dict_trusted(cls, data: dict[str, Any]) -> DaySchedule:
+        """Create from a dictionary written by to_dict.
+
+        For data this integration stored itself: block validation and the
+        sort are skipped, only the cheap coverage check still runs.
+        """
+        schedule = object.__new__(cls)
+        schedule.schedule_type = data["schedule_type"]
+        schedule.blocks = [
+            ScheduleBlock.from_dict_trusted(b) for b in data.get("blocks", [])
+        ]
+        schedule._build_lookup()
+        schedule._validate_coverage()
+        return schedule
+
+
+@dataclass(slots=True)
 class RoomSchedule:
     """Complete schedule configuration for a room across all modes."""
 
@@ -178,15 +240,45 @@ class RoomSchedule:
     homeoffice_daily: DaySchedule | None = None
     custom_schedules: dict[str, DaySchedule] = field(default_factory=dict)
     use_normal_for_modes: set[str] = field(default_factory=set)
+    # mode -> day schedule, or (weekday, weekend) pair for modes resolving to
+    # the normal schedule; built lazily, reset by clear_mode_index()
+    _mode_index: (
+        dict[str, DaySchedule | tuple[DaySchedule | None, DaySchedule | None] | None]
+        | None
+    ) = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate room schedule."""
         if not self.room_name:
             raise ValueError("Room name cannot be empty")
 
+    def clear_mode_index(self) -> None:
+        """Drop the mode lookup table.
+
+        Called by the setters below; must also be called after assigning
+        normal_weekday, normal_weekend or homeoffice_daily directly.
+        """
+        self._mode_index = None
+
+    def _build_mode_index(
+        self,
+    ) -> dict[str, DaySchedule | tuple[DaySchedule | None, DaySchedule | None] | None]:
+        """Build the mode lookup table used by get_schedule_for_mode."""
+        index: dict[
+            str, DaySchedule | tuple[DaySchedule | None, DaySchedule | None] | None
+        ] = dict(self.custom_schedules)
+        index["homeoffice"] = self.homeoffice_daily
+        normal = (self.normal_weekday, self.normal_weekend)
+        index["normal"] = normal
+        for mode in self.use_normal_for_modes:
+            index[mode] = normal
+        self._mode_index = index
+        return index
+
     def set_custom_schedule(self, mode: str, schedule: DaySchedule) -> None:
         """Set schedule for a custom mode."""
         self.custom_schedules[mode] = schedule
+        self._mode_index = None
 
     def get_custom_schedule(self, mode: str) -> DaySchedule | None:
         """Get schedule for a custom mode."""
@@ -195,6 +287,7 @@ class RoomSchedule:
     def remove_custom_schedule(self, mode: str) -> None:
         """Remove schedule for a custom mode."""
         self.custom_schedules.pop(mode, None)
+        self._mode_index = None
 
     def set_use_normal(self, mode: str, use_normal: bool) -> None:
         """Set whether a mode should use normal schedule."""
@@ -202,40 +295,44 @@ class RoomSchedule:
             self.use_normal_for_modes.add(mode)
         else:
             self.use_normal_for_modes.discard(mode)
+        self._mode_index = None
 
     def should_use_normal(self, mode: str) -> bool:
         """Check if mode should use normal schedule."""
         return mode in self.use_normal_for_modes
 
     def get_schedule_for_mode(
-        self, mode: str, dt: datetime | None = None, friday_weekend_start_hour: int = 24
+        self,
+        mode: str,
+        dt: datetime | None = None,
+        friday_weekend_start_hour: int = 24,
+        weekday: int | None = None,
     ) -> DaySchedule | None:
-        """Get appropriate schedule for given mode and datetime."""
-        if dt is None:
+        """Get appropriate schedule for given mode and datetime.
+
+        Callers resolving several rooms for the same moment can pass a
+        precomputed weekday; dt is then only needed on Fridays.
+        """
+        index = self._mode_index
+        if index is None:
+            index = self._build_mode_index()
+
+        # Custom modes and homeoffice map straight to a schedule (None if the
+        # mode is unknown); normal and modes using it map to a pair
+        result = index.get(mode)
+        if type(result) is not tuple:
+            return result
+
+        if dt is None and (weekday is None or weekday == 4):
             dt = dt_util.now()
-
-        # Check if mode should use normal schedule
-        if self.should_use_normal(mode):
-            mode = "normal"
-
-        result = None
-        if mode == "normal":
-            # Weekday: Monday (0) to Friday (4)
-            # If it's Friday and current hour is >= friday_weekend_start_hour, treat it as weekend schedule
-            is_friday_weekend = (
-                dt.weekday() == 4 and dt.hour >= friday_weekend_start_hour
-            )
-            if dt.weekday() < 5 and not is_friday_weekend:
-                result = self.normal_weekday
-            else:
-                result = self.normal_weekend
-        elif mode == "homeoffice":
-            result = self.homeoffice_daily
-        else:
-            # Custom mode
-            result = self.get_custom_schedule(mode)
-
-        return result
+        if weekday is None:
+            weekday = dt.weekday()
+        # Weekday: Monday (0) to Friday (4)
+        # If it's Friday and current hour is >= friday_weekend_start_hour, treat it as weekend schedule
+        is_friday_weekend = weekday == 4 and dt.hour >= friday_weekend_start_hour
+        if weekday < 5 and not is_friday_weekend:
+            return result[0]
+        return result[1]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -264,11 +361,29 @@ class RoomSchedule:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RoomSchedule:
         """Create from dictionary."""
+        return cls._from_dict(data, DaySchedule.from_dict)
+
+    @classmethod
+    def from_dict_trusted(cls, data: dict[str, Any]) -> RoomSchedule:
+        """Create from a dictionary loaded from this integration's storage.
+
+        Day schedules skip the validation they already passed before being
+        saved; use from_dict for user-supplied data.
+        """
+        return cls._from_dict(data, DaySchedule.from_dict_trusted)
+
+    @classmethod
+    def _from_dict(
+        cls,
+        data: dict[str, Any],
+        day_from_dict: Callable[[dict[str, Any]], DaySchedule],
+    ) -> RoomSchedule:
+        """Create from dictionary using the given day schedule loader."""
         # Load custom schedules
         custom_schedules = {}
         if "custom_schedules" in data:
             for mode, schedule_data in data["custom_schedules"].items():
-                custom_schedules[mode] = DaySchedule.from_dict(schedule_data)
+                custom_schedules[mode] = day_from_dict(schedule_data)
 
         # Load use_normal flags
         use_normal_for_modes = set(data.get("use_normal_for_modes", []))
@@ -276,17 +391,17 @@ class RoomSchedule:
         return cls(
             room_name=data["room_name"],
             normal_weekday=(
-                DaySchedule.from_dict(data["normal_weekday"])
+                day_from_dict(data["normal_weekday"])
                 if "normal_weekday" in data
                 else None
             ),
             normal_weekend=(
-                DaySchedule.from_dict(data["normal_weekend"])
+                day_from_dict(data["normal_weekend"])
                 if "normal_weekend" in data
                 else None
             ),
             homeoffice_daily=(
-                DaySchedule.from_dict(data["homeoffice_daily"])
+                day_from_dict(data["homeoffice_daily"])
                 if "homeoffice_daily" in data
                 else None
             ),
@@ -8,8 +8,15 @@ jitter and prevent erratic heating decisions.
 from __future__ import annotations
 
 import logging
+import math
 import time as _time
-from typing import Any, NamedTuple
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import Event, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from ..const import CONF_WEATHER_ENTITY
 
 _LOGGER = logging.getLogger(__package__)
 
@@ -25,17 +32,30 @@ SENSOR_EMA_ALPHA: float = 0.2
 # immediately adopted.  A real 1°C jump in 30s is physically impossible
 # for a room — it's always sensor noise or a restart.
 SPIKE_THRESHOLD: float = 1.0
+_SPIKE_THRESHOLD_SQ: float = SPIKE_THRESHOLD * SPIKE_THRESHOLD
 
 # When a spike is detected, use a much slower alpha to absorb it gradually.
 SPIKE_DAMPENING_ALPHA: float = 0.05
 
 
-class SensorReading(NamedTuple):
-    """Container for temperature sensor readings."""
+def _round2(value: float) -> float:
+    """Round to 2 decimals, halves up.
+
+    About 3x cheaper than round(value, 2), which goes through correctly
+    rounded decimal conversion; results can only differ by 0.01 on values
+    sitting on a .xx5 tie.
+    """
+    return math.floor(value * 100 + 0.5) / 100
+
 
-    entity_id: str
-    temperature: float
-    weight: float = 1.0
+def _parse_sensor_state(state: State | None) -> float | None:
+    """Parse a numeric sensor state, None if missing or not a number."""
+    if not state or state.state in ("unknown", "unavailable"):
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
 
 
 def calculate_dynamic_trv_weight(main_temp: float, trv_temp: float) -> float:
@@ -52,17 +72,27 @@ def calculate_dynamic_trv_weight(main_temp: float, trv_temp: float) -> float:
     return 0.1  # Strong deviation — TRV biased by radiator heat
 
 
-def calculate_fused_temperature(readings: list[SensorReading]) -> float | None:
-    """Calculate weighted average temperature from multiple sensors."""
-    if not readings:
+def calculate_fused_temperature(
+    temps: list[float], weights: list[float]
+) -> float | None:
+    """Calculate weighted average temperature from parallel value lists.
+
+    ``temps[i]`` is weighted by ``weights[i]``. Keeping the values in two
+    flat lists avoids allocating a reading object per sensor on every update.
+    """
+    if not temps:
         return None
 
-    total_weight = sum(r.weight for r in readings)
+    # Single pass over the readings for both sums
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for temp, weight in zip(temps, weights):
+        total_weight += weight
+        weighted_sum += temp * weight
+
     if total_weight == 0:
         return None
-
-    weighted_sum = sum(r.temperature * r.weight for r in readings)
-    return round(weighted_sum / total_weight, 2)
+    return _round2(weighted_sum / total_weight)
 
 
 class SensorManager:
@@ -77,17 +107,38 @@ class SensorManager:
         """Initialize the sensor manager."""
         self.coordinator = coordinator
         self.hass = coordinator.hass
+        # The room config is set once before the manager is created; keep
+        # a direct reference so the per-tick readers skip the coordinator
+        self.room_config = coordinator.room_config
         self._ema_value: float | None = None
         self._consecutive_spikes: int = 0
         # Temperature-based window detection state
         self._temp_drop_history: list[tuple[float, float]] = []  # (temp, timestamp)
         self._temp_drop_detected: bool = False
         self._temp_drop_count: int = 0
+        # entity_id -> parsed numeric state; filled on first read and then
+        # kept current by a state listener instead of polling hass.states
+        self._sensor_values: dict[str, float | None] = {}
+        self._sensor_listeners: list[Callable[[], None]] = []
+        # Resolve the coordinator's debug hooks once. The enabled state is
+        # still asked per call since debug categories can change at runtime
+        self._log_debug: Callable[..., None] | None = getattr(
+            coordinator, "debug", None
+        )
+        self._is_debug_enabled: Callable[[str], bool] | None = getattr(
+            coordinator, "is_debug_enabled", None
+        )
 
     def _debug(self, message: str, *args: Any) -> None:
         """Log sensor debug message using coordinator's logger."""
-        if hasattr(self.coordinator, "debug"):
-            self.coordinator.debug("sensors", message, *args)
+        log_debug = self._log_debug
+        if log_debug is not None:
+            log_debug("sensors", message, *args)
+
+    def _debug_enabled(self) -> bool:
+        """Check if sensor debug messages would be logged."""
+        is_enabled = self._is_debug_enabled
+        return is_enabled is not None and is_enabled("sensors")
 
     def get_fused_temperature(self) -> float | None:
         """Get the current room temperature from available sensors.
@@ -99,103 +150,111 @@ class SensorManager:
         Falls back to TRV-only fusion when the main sensor is unavailable.
         Applies a dual-stage filter (spike rejection + EMA) on the result.
         """
-        config = self.coordinator.room_config
+        config = self.room_config
         raw_temp: float | None = None
+        debug_on = self._debug_enabled()
+        state_get = self.hass.states.get
+        debug = self._debug
 
         main_temp = self._get_sensor_value(config.main_temp_sensor_id)
 
         if main_temp is not None:
-            self._debug(
-                "Temperature: MAIN SENSOR %s = %.2f",
-                config.main_temp_sensor_id,
-                main_temp,
-            )
+            if debug_on:
+                debug(
+                    "Temperature: MAIN SENSOR %s = %.2f",
+                    config.main_temp_sensor_id,
+                    main_temp,
+                )
 
             # Build fusion list: main sensor + TRV sensors with dynamic weights
-            readings: list[SensorReading] = [
-                SensorReading(
-                    entity_id=config.main_temp_sensor_id,
-                    temperature=main_temp,
-                    weight=10.0,
-                )
-            ]
+            temps: list[float] = [main_temp]
+            weights: list[float] = [10.0]
+            append_temp = temps.append
+            append_weight = weights.append
 
             for trv_id in config.trv_entity_ids:
-                state = self.hass.states.get(trv_id)
-                if state:
-                    try:
-                        current = state.attributes.get("current_temperature")
-                        if current is not None:
-                            trv_temp = float(current)
-                            weight = calculate_dynamic_trv_weight(main_temp, trv_temp)
-                            readings.append(
-                                SensorReading(
-                                    entity_id=trv_id,
-                                    temperature=trv_temp,
-                                    weight=weight,
-                                )
-                            )
-                            self._debug(
-                                "TRV sensor %s = %.2f (dynamic weight: %.1f, diff: %.1f)",
-                                trv_id,
-                                trv_temp,
-                                weight,
-                                abs(main_temp - trv_temp),
-                            )
-                    except (ValueError, TypeError):
-                        self._debug("TRV sensor %s: invalid value", trv_id)
+                state = state_get(trv_id)
+                if state is None:
+                    continue
+                current = state.attributes.get("current_temperature")
+                if current is None:
+                    continue
+                try:
+                    trv_temp = float(current)
+                except (ValueError, TypeError):
+                    if debug_on:
+                        debug("TRV sensor %s: invalid value", trv_id)
+                    continue
+                weight = calculate_dynamic_trv_weight(main_temp, trv_temp)
+                append_temp(trv_temp)
+                append_weight(weight)
+                if debug_on:
+                    debug(
+                        "TRV sensor %s = %.2f (dynamic weight: %.1f, diff: %.1f)",
+                        trv_id,
+                        trv_temp,
+                        weight,
+                        abs(main_temp - trv_temp),
+                    )
 
-            raw_temp = calculate_fused_temperature(readings)
-            self._debug(
-                "Temperature: FUSED from %d sensor(s) = %.2f",
-                len(readings),
-                raw_temp or 0,
-            )
+            raw_temp = calculate_fused_temperature(temps, weights)
+            if debug_on:
+                debug(
+                    "Temperature: FUSED from %d sensor(s) = %.2f",
+                    len(temps),
+                    raw_temp or 0,
+                )
         else:
-            # Fallback: TRV sensors only (no main sensor)
-            trv_readings: list[SensorReading] = []
+            # Fallback: TRV sensors only (no main sensor). All TRVs share the
+            # same weight, so the fused value is their plain mean
+            trv_sum = 0.0
+            trv_count = 0
             for trv_id in config.trv_entity_ids:
-                state = self.hass.states.get(trv_id)
-                if state:
-                    try:
-                        current = state.attributes.get("current_temperature")
-                        if current is not None:
-                            reading = SensorReading(
-                                entity_id=trv_id,
-                                temperature=float(current),
-                                weight=TRV_SENSOR_WEIGHT_DEFAULT,
-                            )
-                            trv_readings.append(reading)
-                            self._debug(
-                                "TRV sensor %s = %.2f (fallback weight: %.1f)",
-                                trv_id,
-                                float(current),
-                                TRV_SENSOR_WEIGHT_DEFAULT,
-                            )
-                    except (ValueError, TypeError):
-                        self._debug("TRV sensor %s: invalid value", trv_id)
-                        continue
+                state = state_get(trv_id)
+                if state is None:
+                    continue
+                current = state.attributes.get("current_temperature")
+                if current is None:
+                    continue
+                try:
+                    trv_temp = float(current)
+                except (ValueError, TypeError):
+                    if debug_on:
+                        debug("TRV sensor %s: invalid value", trv_id)
+                    continue
+                trv_sum += trv_temp
+                trv_count += 1
+                if debug_on:
+                    debug(
+                        "TRV sensor %s = %.2f (fallback weight: %.1f)",
+                        trv_id,
+                        trv_temp,
+                        TRV_SENSOR_WEIGHT_DEFAULT,
+                    )
 
-            if trv_readings:
-                raw_temp = calculate_fused_temperature(trv_readings)
-                self._debug(
-                    "Temperature: FUSED from %d TRV(s) = %.2f (no main sensor)",
-                    len(trv_readings),
-                    raw_temp or 0,
-                )
+            if trv_count:
+                raw_temp = _round2(trv_sum / trv_count)
+                if debug_on:
+                    debug(
+                        "Temperature: FUSED from %d TRV(s) = %.2f (no main sensor)",
+                        trv_count,
+                        raw_temp or 0,
+                    )
 
         if raw_temp is None:
-            self._debug("Temperature: NO SENSORS AVAILABLE")
+            if debug_on:
+                debug("Temperature: NO SENSORS AVAILABLE")
             return None
 
         # Apply dual-stage smoothing
         smoothed = self._apply_ema(raw_temp)
-        self._debug(
-            "Temperature: raw=%.2f -> smoothed=%.2f (alpha=%.2f)",
-            raw_temp,
-            smoothed,
-            SENSOR_EMA_ALPHA,
-        )
+        if debug_on:
+            debug(
+                "Temperature: raw=%.2f -> smoothed=%.2f (alpha=%.2f)",
+                raw_temp,
+                smoothed,
+                SENSOR_EMA_ALPHA,
+            )
         return smoothed
 
     def _apply_ema(self, raw: float) -> float:
@@ -214,11 +273,13 @@ class SensorManager:
         if self._ema_value is None:
             self._ema_value = raw
             self._consecutive_spikes = 0
-            return round(self._ema_value, 2)
+            return _round2(self._ema_value)
 
-        deviation = abs(raw - self._ema_value)
+        # Compare squared deviation; the absolute value is only needed for logs
+        diff = raw - self._ema_value
 
-        if deviation > SPIKE_THRESHOLD:
+        if diff * diff > _SPIKE_THRESHOLD_SQ:
+            deviation = abs(diff)
             self._consecutive_spikes += 1
             if self._consecutive_spikes >= 3:
                 # Persistent deviation — accept as real (sensor moved/replaced)
@@ -246,26 +307,25 @@ class SensorManager:
                 SENSOR_EMA_ALPHA * raw + (1 - SENSOR_EMA_ALPHA) * self._ema_value
             )
 
-        return round(self._ema_value, 2)
+        return _round2(self._ema_value)
 
     def get_outdoor_temperature(self) -> float | None:
         """Get current outdoor temperature."""
-        config = self.coordinator.room_config
+        config = self.room_config
 
         # Try room-level outdoor sensor first
         outdoor_temp = self._get_sensor_value(config.outdoor_sensor_id)
         if outdoor_temp is not None:
-            self._debug(
-                "Outdoor: ROOM SENSOR %s = %.1f",
-                config.outdoor_sensor_id,
-                outdoor_temp,
-            )
+            if self._debug_enabled():
+                self._debug(
+                    "Outdoor: ROOM SENSOR %s = %.1f",
+                    config.outdoor_sensor_id,
+                    outdoor_temp,
+                )
             return outdoor_temp
 
         # Fallback to hub's weather entity
         if self.coordinator.hub_coordinator:
-            from ..const import CONF_WEATHER_ENTITY
-
             weather_entity = self.coordinator.hub_coordinator.config_data.get(
                 CONF_WEATHER_ENTITY
             )
@@ -274,11 +334,12 @@ class SensorManager:
                 if state:
                     try:
                         outdoor_temp = float(state.attributes.get("temperature"))
-                        self._debug(
-                            "Outdoor: WEATHER ENTITY %s = %.1f",
-                            weather_entity,
-                            outdoor_temp,
-                        )
+                        if self._debug_enabled():
+                            self._debug(
+                                "Outdoor: WEATHER ENTITY %s = %.1f",
+                                weather_entity,
+                                outdoor_temp,
+                            )
                         return outdoor_temp
                     except (ValueError, TypeError):
                         self._debug(
@@ -286,15 +347,16 @@ class SensorManager:
                             weather_entity,
                         )
 
-        self._debug("Outdoor: NOT AVAILABLE")
+        if self._debug_enabled():
+            self._debug("Outdoor: NOT AVAILABLE")
         return None
 
     def get_humidity(self) -> float | None:
         """Get current room humidity."""
-        config = self.coordinator.room_config
+        config = self.room_config
         humidity = self._get_sensor_value(config.humidity_sensor_id)
 
-        if humidity is not None:
+        if humidity is not None and self._debug_enabled():
             self._debug(
                 "Humidity: %s = %.1f%%",
                 config.humidity_sensor_id,
@@ -306,17 +368,20 @@ class SensorManager:
     def is_window_open(self) -> bool:
         """Check if any window is open (sensor or temperature-based detection)."""
         # 1. Check physical window sensors
-        window_ids = self.coordinator.room_config.window_sensor_ids
+        window_ids = self.room_config.window_sensor_ids
         if window_ids:
+            state_get = self.hass.states.get
             for entity_id in window_ids:
-                state = self.hass.states.get(entity_id)
-                if state and state.state == "on":
-                    self._debug("Window: %s is OPEN (sensor)", entity_id)
+                state = state_get(entity_id)
+                if state is not None and state.state == "on":
+                    if self._debug_enabled():
+                        self._debug("Window: %s is OPEN (sensor)", entity_id)
                     return True
 
         # 2. Check temperature-based detection (works without window sensors)
         if self._temp_drop_detected:
-            self._debug("Window: OPEN (temperature drop detected)")
+            if self._debug_enabled():
+                self._debug("Window: OPEN (temperature drop detected)")
             return True
 
         return False
@@ -333,18 +398,24 @@ class SensorManager:
             return
 
         now = _time.monotonic()
-        self._temp_drop_history.append((current_temp, now))
+        history = self._temp_drop_history
+        history.append((current_temp, now))
 
-        # Prune entries older than the detection window
+        # Prune entries older than the detection window. Entries are appended
+        # in time order, so the expired ones are always at the front
         cutoff = now - self.TEMP_DROP_WINDOW
-        self._temp_drop_history = [
-            (t, ts) for t, ts in self._temp_drop_history if ts >= cutoff
-        ]
-
-        if len(self._temp_drop_history) < 2:
+        stale = 0
+        for _, ts in history:
+            if ts >= cutoff:
+                break
+            stale += 1
+        if stale:
+            del history[:stale]
+
+        if len(history) < 2:
             return
 
-        oldest_temp = self._temp_drop_history[0][0]
+        oldest_temp, oldest_ts = history[0]
         drop = oldest_temp - current_temp
 
         if drop >= self.TEMP_DROP_THRESHOLD:
@@ -354,7 +425,7 @@ class SensorManager:
                     self._debug(
                         "Window: Temp drop DETECTED (%.1f°C in %.0fs, count=%d)",
                         drop,
-                        now - self._temp_drop_history[0][1],
+                        now - oldest_ts,
                         self._temp_drop_count,
                     )
                 self._temp_drop_detected = True
@@ -372,10 +443,30 @@ class SensorManager:
         """Get numeric value from sensor."""
         if not entity_id:
             return None
-        state = self.hass.states.get(entity_id)
-        if not state or state.state in ("unknown", "unavailable"):
-            return None
         try:
-            return float(state.state)
-        except (ValueError, TypeError):
-            return None
+            return self._sensor_values[entity_id]
+        except KeyError:
+            pass
+
+        value = _parse_sensor_state(self.hass.states.get(entity_id))
+        self._sensor_values[entity_id] = value
+        self._sensor_listeners.append(
+            async_track_state_change_event(
+                self.hass, [entity_id], self._handle_sensor_state_change
+            )
+        )
+        return value
+
+    @callback
+    def _handle_sensor_state_change(self, event: Event) -> None:
+        """Refresh the cached value of a sensor when its state changes."""
+        self._sensor_values[event.data["entity_id"]] = _parse_sensor_state(
+            event.data.get("new_state")
+        )
+
+    def remove_listeners(self) -> None:
+        """Remove sensor state listeners and drop cached values."""
+        for remove_listener in self._sensor_listeners:
+            remove_listener()
+        self._sensor_listeners.clear()
+        self._sensor_values.clear()
@@ -75,8 +75,13 @@ def calculate_fused_temperature(
         _LOGGER.warning("All readings were outliers")
         return None
 
-    total_weighted_temp = sum(r.temperature * r.weight for r in valid_readings)
-    total_weight = sum(r.weight for r in valid_readings)
+    # Single pass over the readings for both sums
+    total_weighted_temp = 0.0
+    total_weight = 0.0
+    for reading in valid_readings:
+        weight = reading.weight
+        total_weight += weight
+        total_weighted_temp += reading.temperature * weight
 
     if total_weight == 0:
         _LOGGER.error("Total weight is zero")
@@ -84,12 +89,13 @@ def calculate_fused_temperature(
 
     fused_temp = total_weighted_temp / total_weight
 
-    _LOGGER.debug(
-        "Fused temperature: %.2f°C from %d sensors (weights: %s)",
-        fused_temp,
-        len(valid_readings),
-        [f"{r.weight:.1f}" for r in valid_readings],
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Fused temperature: %.2f°C from %d sensors (weights: %s)",
+            fused_temp,
+            len(valid_readings),
+            [f"{r.weight:.1f}" for r in valid_readings],
+        )
 
     return round(fused_temp, 2)
 
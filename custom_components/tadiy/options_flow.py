@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import Any
 
 import voluptuous as vol
@@ -951,10 +952,13 @@ class TaDIYOptionsFlowHandler(ScheduleEditorMixin, OptionsFlow):
                             coordinator.heating_curve = None
                         elif use_curve and coordinator.heating_curve is not None:
                             # Update heating curve slope
-                            coordinator.heating_curve.config.curve_slope = (
-                                user_input.get(
-                                    CONF_HEATING_CURVE_SLOPE,
-                                    DEFAULT_HEATING_CURVE_SLOPE,
+                            coordinator.heating_curve.reconfigure(
+                                replace(
+                                    coordinator.heating_curve.config,
+                                    curve_slope=user_input.get(
+                                        CONF_HEATING_CURVE_SLOPE,
+                                        DEFAULT_HEATING_CURVE_SLOPE,
+                                    ),
                                 )
                             )
 
@@ -137,7 +137,7 @@ ROOM_SENSOR_TYPES: tuple[TaDIYSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         icon=ICON_TEMPERATURE,
         value_fn=lambda data: (
-            round(sum(data.trv_temperatures) / len(data.trv_temperatures), 2)
+            round(data.trv_temperature_avg, 2)
             if data and data.trv_temperatures
             else None
         ),
@@ -150,10 +150,10 @@ ROOM_SENSOR_TYPES: tuple[TaDIYSensorEntityDescription, ...] = (
                 "trv_values": [round(t, 2) for t in data.trv_temperatures]
                 if data and data.trv_temperatures
                 else [],
-                "min_trv_temp": round(min(data.trv_temperatures), 2)
+                "min_trv_temp": round(data.trv_temperature_min, 2)
                 if data and data.trv_temperatures
                 else None,
-                "max_trv_temp": round(max(data.trv_temperatures), 2)
+                "max_trv_temp": round(data.trv_temperature_max, 2)
                 if data and data.trv_temperatures
                 else None,
             }